@@ -1,7 +1,8 @@
 from PySide6 import QtWidgets
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QTimer, QEvent
 from PySide6.QtWidgets import QLineEdit, QMessageBox, QLabel, QPushButton, QRadioButton
 
+import mdb_io as mio
 import mdb_utils as mut
 
 import logging
@@ -27,6 +28,7 @@ class MouseEditor(QtWidgets.QDialog):
 
         self.setWindowTitle(f"{mode.capitalize()} Mouse Entries")
         self.setModal(True)
+        self.setStyleSheet("QLineEdit[invalid='true'] { background-color: salmon; }") # Parsed once, entries only flip the property
 
         self.main_layout = QtWidgets.QVBoxLayout(self)
         self.edit_entry_form_layout = QtWidgets.QGridLayout()
@@ -45,6 +47,14 @@ class MouseEditor(QtWidgets.QDialog):
         self.reroll_timer = QTimer(self)
         self.reroll_timer.timeout.connect(self._update_id_animation)
         self.reroll_delay = 50  # Milliseconds between updates
+        self.reroll_pool = None
+        self.reroll_index = 0
+
+        # Input validation control, bursts of keystrokes are validated once
+        self.validate_timer = QTimer(self)
+        self.validate_timer.setSingleShot(True)
+        self.validate_timer.timeout.connect(self._save_blocker)
+        self.validate_delay = 150  # Milliseconds of typing pause before validating
 
         self.setup_editor_ui()
 
@@ -61,6 +71,7 @@ class MouseEditor(QtWidgets.QDialog):
         save_command = getattr(self, f"save_{self.mode}_entry")
         self.save_edit_button.clicked.connect(save_command)
         self.save_edit_button.setEnabled(False)
+        self.validate_timer.stop() # Prefilled entries of edit mode are not a change yet
         self.main_layout.addWidget(self.save_edit_button)
 
     def edit_id_element(self):
@@ -81,8 +92,8 @@ class MouseEditor(QtWidgets.QDialog):
         else:
             self.reroll_active = True
             self.reroll_delay = 50  # FPS = 1000 / 50 = 20
+            self.reroll_pool = mut.generate_random_ids(256) # Cosmetic IDs drawn in one go, cycled through by the animation
             self.disp_id_entry.setFocusPolicy(Qt.NoFocus) # Disable focus to prevent manual editing
-            self.reroll_timer.start(self.reroll_delay) # Start animation immediately for new entry
 
     def edit_sex_element(self):
         """
@@ -123,7 +134,7 @@ class MouseEditor(QtWidgets.QDialog):
 
         if self.mode == "edit":
             self.edit_toe_entry.setText(self.edit_mouse_var.get("toe", "").replace("toe", ""))
-        self.edit_toe_entry.textChanged.connect(self._save_blocker)
+        self.edit_toe_entry.textChanged.connect(self._schedule_save_blocker)
 
     def edit_genotype_element(self): # TODO: Make a drop down list from existing genotypes (which can be increased from, say, a separate config mechanism)
         """
@@ -135,7 +146,7 @@ class MouseEditor(QtWidgets.QDialog):
 
         if self.mode == "edit":
             self.edit_genotype_entry.setText(self.edit_mouse_var.get("genotype", ""))
-        self.edit_genotype_entry.textChanged.connect(self._save_blocker)
+        self.edit_genotype_entry.textChanged.connect(self._schedule_save_blocker)
 
     def edit_birthdate_element(self): # TODO: CALENDAR WIDGET INSTEAD OF DIRECT INPUT!
         """
@@ -144,7 +155,7 @@ class MouseEditor(QtWidgets.QDialog):
         birthdate_label = QLabel("Birth Date:")
         self.edit_entry_form_layout.addWidget(birthdate_label, 4, 0)
         self.edit_entry_form_layout.addWidget(self.edit_birthdate_entry, 4, 1, 1, 2)
-        self.edit_birthdate_entry.textChanged.connect(self._save_blocker)
+        self.edit_birthdate_entry.textChanged.connect(self._schedule_save_blocker)
 
         if self.mode == "edit":
             birth_date = self.edit_mouse_var.get("birthDate", "")
@@ -158,7 +169,7 @@ class MouseEditor(QtWidgets.QDialog):
         breeddate_label = QLabel("Breed Date:")
         self.edit_entry_form_layout.addWidget(breeddate_label, 5, 0)
         self.edit_entry_form_layout.addWidget(self.edit_breeddate_entry, 5, 1, 1, 2)
-        self.edit_breeddate_entry.textChanged.connect(self._save_blocker)
+        self.edit_breeddate_entry.textChanged.connect(self._schedule_save_blocker)
 
         if self.mode == "edit" and self.edit_mouse_var.get("category") != "BACKUP":
             breed_date = self.edit_mouse_var.get("breedDate", "")
@@ -195,9 +206,9 @@ class MouseEditor(QtWidgets.QDialog):
         logging.debug(f"Toe valid: '{validated_toe}'")
         if validated_toe == "69":
             logging.debug(f"Invalid Toe detected: '{input_toe_str}'")
-            self.edit_toe_entry.setStyleSheet("background-color: salmon;")
+            self._mark_entry(self.edit_toe_entry, valid=False)
             return False
-        self.edit_toe_entry.setStyleSheet("") # Clear background color
+        self._mark_entry(self.edit_toe_entry, valid=True) # Clear background color
         return True
 
     def _validate_date_input(self, date_mode: str):
@@ -217,18 +228,30 @@ class MouseEditor(QtWidgets.QDialog):
         validated_date = mut.convert_to_date(input_date_str)
         if validated_date is None:
             logging.debug(f"Invalid {date_mode} detected: '{input_date_str}'")
-            if date_mode == "birthdate":
-                self.edit_birthdate_entry.setStyleSheet("background-color: salmon;")
-            else:
-                self.edit_breeddate_entry.setStyleSheet("background-color: salmon;")
+            self._mark_entry(self.edit_birthdate_entry if date_mode == "birthdate" else self.edit_breeddate_entry, valid=False)
             return False
         logging.debug(f"Valid {date_mode.capitalize()}: '{input_date_str}' -> {validated_date}")
-        if date_mode == "birthdate":
-            self.edit_birthdate_entry.setStyleSheet("")
-        else:
-            self.edit_breeddate_entry.setStyleSheet("") 
+        self._mark_entry(self.edit_birthdate_entry if date_mode == "birthdate" else self.edit_breeddate_entry, valid=True)
         return True
+
+    def _mark_entry(self, entry, valid:bool):
+        """Colors an invalid entry salmon through the dialog stylesheet, repolishing only when its state flips."""
+        if bool(entry.property("invalid")) != (not valid):
+            entry.setProperty("invalid", not valid)
+            entry.style().unpolish(entry)
+            entry.style().polish(entry)
         
+    def _schedule_save_blocker(self):
+        """Restarts the validation countdown, so only the last keystroke of a burst validates."""
+        self.validate_timer.start(self.validate_delay)
+
+    def _flush_save_blocker(self):
+        """Runs a pending validation right away, returns whether the inputs may be saved."""
+        if self.validate_timer.isActive():
+            self.validate_timer.stop()
+            self._save_blocker()
+        return self.save_edit_button.isEnabled()
+
     def _save_blocker(self):
         """Enables or disables the save button based on the validity of inputs."""
         check_genotype = self._validate_genotype_input()
@@ -249,6 +272,8 @@ class MouseEditor(QtWidgets.QDialog):
         Performs basic validation and generates a unique ID.
         """
         logging.debug("save_new_entry called.")
+        if not self._flush_save_blocker(): # Clicked before the last keystrokes were validated
+            return
         cage = "Waiting Room"
         selected_sex_button = self.edit_sex_group.checkedButton()
         sex = selected_sex_button.text() if selected_sex_button else ""
@@ -281,14 +306,14 @@ class MouseEditor(QtWidgets.QDialog):
             "nuCA": cage,"category": cage
         }
 
-        # Find a unique key for the new entry in mouseDB
-        new_key = len(self.mouseDB) if self.mouseDB else 0
-        while new_key in self.mouseDB:
-            new_key += 1
-        self.mouseDB[new_key] = new_mouse_data
+        # mouseDB is keyed by mouse ID, like the entries loaded from the sheet
+        if new_id in self.mouseDB:
+            QMessageBox.critical(self, "Input Error", f"A mouse with ID {new_id} already exists.")
+            return
+        self.mouseDB[new_id] = new_mouse_data
 
         QMessageBox.information(self, "Success", f"New mouse entry added with ID: {new_id}")
-        self._close_and_refresh()
+        self._close_and_refresh([new_mouse_data])
 
     def save_edit_entry(self):
         """
@@ -296,6 +321,8 @@ class MouseEditor(QtWidgets.QDialog):
         Validates inputs and updates the corresponding mouse data.
         """
         logging.debug("save_edit_entry called.")
+        if not self._flush_save_blocker(): # Clicked before the last keystrokes were validated
+            return
         selected_id = self.edit_mouse_var.get("ID")
         if not selected_id:
             logging.warning("No mouse selected for editing.")
@@ -333,33 +360,69 @@ class MouseEditor(QtWidgets.QDialog):
         breed_days = mut.date_to_days(updated_breed_date) if updated_breed_date else None
         logging.debug(f"Calculated age_days: {age}, breed_days: {breed_days}")
 
-        # Update the mouse data
-        self.mouseDB[mouse_key_to_update]["sex"] = updated_sex
-        self.mouseDB[mouse_key_to_update]["toe"] = updated_toe
-        self.mouseDB[mouse_key_to_update]["genotype"] = updated_genotype
-        self.mouseDB[mouse_key_to_update]["birthDate"] = updated_birth_date
-        self.mouseDB[mouse_key_to_update]["age"] = age
-        self.mouseDB[mouse_key_to_update]["breedDate"] = updated_breed_date
-        self.mouseDB[mouse_key_to_update]["breedDays"] = breed_days
+        # Update the mouse data, age and breedDays follow from the dates so only the edited fields are compared
+        mouse_to_update = self.mouseDB[mouse_key_to_update]
+        updated_fields = {"sex": updated_sex, "toe": updated_toe, "genotype": updated_genotype,
+                          "birthDate": updated_birth_date, "breedDate": updated_breed_date}
+        compared_fields = [field for field in updated_fields # A read-only "Non Applicable" breed date cannot have been edited
+                           if not (field == "breedDate" and self.edit_breeddate_entry.isReadOnly())]
+        stored_fields = {field: mouse_to_update.get(field) for field in compared_fields}
+        for field in ("birthDate", "breedDate"): # Dates read from the sheet may be Timestamp / NaT, the form gives date / None
+            if field in stored_fields:
+                stored_fields[field] = mut.convert_to_date(stored_fields[field])
+        if not any(mio.field_changed(updated_fields[field], stored_fields[field]) for field in compared_fields):
+            logging.debug(f"Mouse {selected_id} unchanged, skipping update and redraw.")
+            self.accept()
+            return
+        mouse_to_update.update(updated_fields, age=age, breedDays=breed_days)
         logging.debug(f"Mouse {selected_id} data updated in mouseDB.")
         
         self.gui.determine_save_status() # Use gui's method to update save button state
         QMessageBox.information(self, "Success", f"Mouse entry {selected_id} updated.")
-        self._close_and_refresh()
+        self._close_and_refresh([mouse_to_update])
 
     #########################################################################################################################
 
-    def _close_and_refresh(self):
+    def _close_and_refresh(self, changed_mice=None):
         """Closes the edit window and refreshes the GUI."""
         logging.debug("_close_and_refresh called.")
         self.accept() # Close the dialog
-        self.gui.redraw_canvas()
+        self.gui.redraw_canvas(changed_mice=changed_mice)
         self.gui.determine_save_status()
         logging.debug("Edit window closed and GUI refreshed.")
 
+    def showEvent(self, event):
+        """Starts the ID animation once the dialog is on screen."""
+        super().showEvent(event)
+        self._start_reroll()
+
+    def hideEvent(self, event):
+        """Stops the ID animation and any pending validation when the dialog is closed or hidden."""
+        self._stop_reroll()
+        self.validate_timer.stop()
+        super().hideEvent(event)
+
+    def changeEvent(self, event):
+        """Pauses the ID animation while the dialog is not the active window."""
+        if event.type() == QEvent.ActivationChange and self.isActiveWindow():
+            self._start_reroll()
+        elif event.type() == QEvent.ActivationChange:
+            self._stop_reroll()
+        super().changeEvent(event)
+
+    def _start_reroll(self):
+        if self.reroll_active and self.isVisible() and not self.reroll_timer.isActive():
+            self.reroll_timer.start(self.reroll_delay)
+
+    def _stop_reroll(self):
+        self.reroll_timer.stop()
+
     def _update_id_animation(self):
         """Updates the ID display with a random ID."""
-        if self.reroll_active:
-            self.disp_id_entry.setText(mut.generate_random_id())
+        if self.reroll_active and self.isVisible():
+            self.reroll_index = (self.reroll_index + 1) & 0xFF
+            if not self.reroll_index: # Pool cycled through, draw a fresh one so the animation never visibly repeats
+                self.reroll_pool = mut.generate_random_ids(256)
+            self.disp_id_entry.setText(self.reroll_pool[self.reroll_index])
         else:
             self.reroll_timer.stop()
\ No newline at end of file
@@ -1,21 +1,29 @@
 import os
-import copy
+from concurrent.futures import ThreadPoolExecutor
 
 from PySide6 import QtWidgets
 from PySide6.QtWidgets import QWidget, QPushButton, QVBoxLayout, QHBoxLayout, QFileDialog, QMessageBox
 
-import mdb_io as mio
-import mdb_pedig as mped
-import mdb_plot as mplt
-import mdb_vis as mvis
-import mdb_edit as medit
-import mdb_transfer as mtrans
-
 import traceback
 import logging
 
 logging.getLogger().setLevel(logging.INFO)
 
+# The mdb modules pull in pandas and matplotlib, they are imported on first file load so the window shows up right away
+mio = mped = mplt = mvis = medit = mtrans = None
+
+def import_mdb_modules():
+    global mio, mped, mplt, mvis, medit, mtrans
+    if mio is not None:
+        return
+    import mdb_io as mio
+    import mdb_pedig as mped
+    import mdb_plot as mplt
+    import mdb_vis as mvis
+    import mdb_edit as medit
+    import mdb_transfer as mtrans
+    logging.debug("mdb modules imported.")
+
 class MouseDatabaseGUI(QWidget):
     def __init__(self):
         super().__init__()
@@ -88,9 +96,13 @@ class MouseDatabaseGUI(QWidget):
 
         self.file_path = None
         self.backup_file = None
+        self.backup_executor = ThreadPoolExecutor(max_workers=1) # Copies the workbook off the GUI thread
+        self.backup_future = None
 
         self.processed_data = None
         self.mouseDB = None
+        self.mice_by_category = None # Built on first use, dropped whenever mouseDB changes
+        self.mouse_categories = {} # Mouse ID -> the category list it sits in, so single moves can be patched
 
         # The category is based on genotype and breeding strategy, unlike self.visualizer.status which is based on mice's cage status in a category
         # category1 ( status1, status2, status3 ... ), category 2 ( status1, status2, status3 ... ), ...
@@ -101,6 +113,7 @@ class MouseDatabaseGUI(QWidget):
         self.visualizer = None
         self.editor = None
         self.plotter = None
+        self.transfer_instance = None
         
         self.canvas_widget = None
         self.last_action = "analyze"
@@ -136,10 +149,16 @@ class MouseDatabaseGUI(QWidget):
             logging.debug("No file selected in load_excel_file.")
             return False
         self.is_saved = True
+        import_mdb_modules() # Every other action needs a loaded file, so this is the first place they are used
         try:
-            mio.validate_excel(self.file_path)
-            self.processed_data = mio.data_preprocess(self.file_path, "MDb")
-            self.mouseDB = copy.deepcopy(self.processed_data) # Original data serving as change tracker
+            self.processed_data = mio.load_preprocess_cache(self.file_path) # Skip parsing if this file was already processed today
+            if self.processed_data is None:
+                df_sheet = mio.validate_excel(self.file_path)
+                self.processed_data = mio.data_preprocess(df_sheet)
+                if self.processed_data is not None:
+                    mio.save_preprocess_cache(self.file_path, self.processed_data)
+            self.mouseDB = self._snapshot_database(self.processed_data) # Original data serving as change tracker
+            self.mice_by_category = None
             self.current_category = self.category_names[0]
             self._update_control_ui()
             if self.processed_data is None:
@@ -171,14 +190,17 @@ class MouseDatabaseGUI(QWidget):
                 logging.error("Error generating log file, save operation cancelled.")
                 QMessageBox.information(self, "Changes Not Logged", f"Log file fail to generate. \n{traceback.format_exc()}")
                 return
-            if not mio.create_backup(self.file_path):
+            self.backup_file = self._collect_backup()
+            if not self.backup_file:
                 logging.error("Error generating backup, save operation cancelled.")
                 QMessageBox.information(self, "Backup Not created", f"Fail to create backup. \n{traceback.format_exc()}")
 
             logging.info(f"Changes logged and saved to: {log_file}")
             QMessageBox.information(self, "Changes Logged", f"Mice changes Logged to: \n{log_file}")
             if mio.write_processed_data_to_excel(self.file_path, self.mouseDB):
-                self.processed_data = copy.deepcopy(self.mouseDB) # Update the reference data upon successfully saving
+                self.processed_data = self._snapshot_database(self.mouseDB) # Update the reference data upon successfully saving
+                self.mice_by_category = None # Saving moves Death Row mice to Memorial
+                self.backup_future = None # Later saves need a fresh backup of the file just written
         except Exception as e:
             logging.error(f"Failed to save Excel file: {e}", exc_info=True)
             QMessageBox.critical(self, "Error", f"Failed to save Excel file: {e}\n{traceback.format_exc()}")
@@ -205,6 +227,8 @@ class MouseDatabaseGUI(QWidget):
                 QMessageBox.information(self, "Changelog Applied","\n".join(result_message))
             self.is_saved = False
             self.save_button.setEnabled(True)
+            self._start_backup()
+            self.mice_by_category = None
             self._perform_analysis_action()
         except Exception as e:
             logging.error(f"Error loading or applying changelog: {e}", exc_info=True)
@@ -263,17 +287,78 @@ class MouseDatabaseGUI(QWidget):
         if mio.find_changes_for_changelog(self.processed_data, self.mouseDB, check_only=True):
             self.is_saved = False
             self.save_button.setEnabled(True)
+            self._start_backup()
         else:
             self.is_saved = True
             self.save_button.setEnabled(False)
 
-    def redraw_canvas(self):
-        """Public method to trigger canvas redraw based on current state."""
-        logging.debug("GUI: redraw_canvas called. Triggering _perform_analysis_action.")
+    def get_category_mice(self, category):
+        """Returns the mice of one category, indexing mouseDB by category once instead of on every switch."""
+        if self.mice_by_category is None:
+            self.mice_by_category = {}
+            self.mouse_categories = {}
+            for mouse_info in (self.mouseDB or {}).values():
+                self.mice_by_category.setdefault(mouse_info.get("category"), []).append(mouse_info)
+                self.mouse_categories[mouse_info.get("ID")] = mouse_info.get("category")
+        return self.mice_by_category.get(category, [])
+
+    def _update_category_index(self, changed_mice):
+        """Moves only the given mice to the list of their current category, instead of indexing every mouse again."""
+        if self.mice_by_category is None:
+            return # Not built yet, the next lookup indexes everything anyway
+        for mouse_info in changed_mice:
+            mouse_id, category = mouse_info.get("ID"), mouse_info.get("category")
+            if mouse_id in self.mouse_categories:
+                old_category = self.mouse_categories[mouse_id]
+                if old_category == category:
+                    continue
+                self.mice_by_category[old_category] = [mouse for mouse in self.mice_by_category[old_category] if mouse is not mouse_info]
+            self.mice_by_category.setdefault(category, []).append(mouse_info)
+            self.mouse_categories[mouse_id] = category
+
+    def _start_backup(self):
+        """Starts copying the workbook off the GUI thread on the first unsaved change, so saving only has to wait for it."""
+        if self.backup_future is None and self.file_path and not self.is_debug: # Debug saves never touch the workbook
+            self.backup_future = self.backup_executor.submit(mio.create_backup, self.file_path)
+
+    def _collect_backup(self):
+        """Waits for the backup started on the first change, or creates one now if there is none pending."""
+        if self.backup_future is None:
+            return mio.create_backup(self.file_path)
+        backup_file = self.backup_future.result()
+        self.backup_future = None
+        return backup_file
+
+    def _snapshot_database(self, mouse_db):
+        """Copies every mouse entry so edits to one database don't leak into the other.
+        Entries only hold immutable values (str, numbers, dates), so copying each dict
+        is equivalent to a deepcopy without its per-value memo bookkeeping."""
+        if mouse_db is None:
+            return None
+        return {mouse_id: mouse_info.copy() for mouse_id, mouse_info in mouse_db.items()}
+
+    def redraw_canvas(self, recount=True, changed_mice=None):
+        """
+        Public method to trigger canvas redraw based on current state.
+        changed_mice lists the mice just added or moved, only those get re-indexed by category.
+        Leave it as None when any part of mouseDB may have changed.
+        """
+        logging.debug(f"GUI: redraw_canvas called. recount: {recount}")
+        if changed_mice is None:
+            self.mice_by_category = None
+        else:
+            self._update_category_index(changed_mice)
+        if self.visualizer and self.canvas_widget and self.visualizer.refresh_cage_monitor(recount):
+            return # Monitor redrawn in place, no need to tear down and rebuild the view
+        if self.plotter and self.canvas_widget and self.plotter.display_genotype_bar_plot():
+            return # Same for the genotype plot, redrawn on its existing figure
         self._perform_analysis_action()
         
     def _reset_state(self):
         self.file_path = None
+        self.backup_file = None
+        self.backup_future = None
+        self.mice_by_category = None
         self.category_names = ["BACKUP", "NEX + PP2A", "CMV + PP2A"]
         self.category_index = 0
         self.current_category = None
@@ -359,8 +444,12 @@ class MouseDatabaseGUI(QWidget):
     def transfer_mouse_action(self, action_type): # Wrapper for transfer
         self.selected_mouse = self.visualizer.selected_mouse
         logging.debug(f"GUI: Initiating transfer action: {action_type} for mouse ID: {self.selected_mouse.get('ID')}")
-        # Pass self (the GUI instance) as the parent for the transfer dialog
-        transfer_instance = mtrans.MouseTransfer(self, self.mouseDB, self.current_category, self.visualizer.mice_status)
+        # Pass self (the GUI instance) as the parent for the transfer dialog, built once and pointed at the current data on every transfer
+        if self.transfer_instance is None:
+            self.transfer_instance = mtrans.MouseTransfer(self, self.mouseDB, self.current_category, self.visualizer.mice_status)
+        else:
+            self.transfer_instance.retarget(self.mouseDB, self.current_category, self.visualizer.mice_status)
+        transfer_instance = self.transfer_instance
         if action_type == "death_row":
             transfer_instance.transfer_to_death_row()
         elif action_type == "existing_cage":
@@ -407,6 +496,7 @@ class MouseDatabaseGUI(QWidget):
         # Clean up resources
         if self.canvas_widget:
             self.canvas_widget.deleteLater()
+        self.backup_executor.shutdown(wait=True) # Let a running backup finish copying
 
         event.accept() # Accept the close event
 
@@ -1,5 +1,12 @@
+import os
+import glob
+import json
+import stat
 import shutil
+import hashlib
+import importlib.util
 
+import numpy as np
 import pandas as pd
 from datetime import date, datetime
 
@@ -8,6 +15,9 @@ import mdb_utils as mut
 import traceback
 import logging
 
+# Rust-backed streaming xlsx reader, far lighter than openpyxl's DOM for large sheets,
+# otherwise let pandas fall back to its default engine (openpyxl)
+READ_ENGINE = "calamine" if importlib.util.find_spec("python_calamine") else None
 
 """
 This module handles input/output operations for the MouseSheetDB, including reading, writing,
@@ -16,6 +26,8 @@ validating Excel files, managing changelogs, and processing mouse data.
 
 # Define required columns for the mouse databasefor loaded Excel
 REQUIRED_COLUMNS = ["ID", "cage", "sex", "toe", "genotype", "birthDate", "breedDate"]
+# Define columns stored in the "MDb" sheet, any other column is skipped when reading and never written back
+SHEET_COLUMNS = ["ID", "cage", "sex", "toe", "genotype", "birthDate", "age", "breedDate", "breedDays", "parentF", "parentM"]
 # Define columns that contain date information
 DATE_COLUMNS = ["birthDate", "breedDate"]
 # Define columns used for comparing old and new mouse data in the changelog
@@ -28,23 +40,29 @@ KEEP_COLUMNS = ["ID"] + COMPARE_COLUMNS + ["age", "breedDays", "category"]
 MANUAL_COLUMNS = ["cage", "nuCA", "sex", "toe", "genotype", "birthDate"]
 
 
-def data_preprocess(excel_file, sheet_name):
+def data_preprocess(excel_file, sheet_name="MDb", engine=READ_ENGINE):
     """
     Preprocesses Excel data from a specified sheet and returns it as a dictionary.
     Args:
-        excel_file (str): The path to the Excel file.
-        sheet_name (str): The name of the sheet to read from.
+        excel_file (str or pd.DataFrame): The path to the Excel file, or the sheet already
+                                          parsed (e.g. as returned by validate_excel).
+        sheet_name (str, optional): The name of the sheet to read from when a path is given.
+                                    Defaults to "MDb".
+        engine (str, optional): The pandas Excel engine used when a path is given.
+                                Defaults to READ_ENGINE (calamine when installed).
     Returns:
         dict: A dictionary where keys are row indices and values are dictionaries
               representing processed mouse data, or None if an error occurs.
     """
     try:
-        excel_file_obj = pd.ExcelFile(excel_file)
-        df_sheet = excel_file_obj.parse(sheet_name)
-        excel_file_obj.close()
+        if isinstance(excel_file, pd.DataFrame): # Already parsed, skip reopening the workbook
+            df_sheet = excel_file
+        else:
+            with pd.ExcelFile(excel_file, engine=engine) as excel_file_obj:
+                df_sheet = excel_file_obj.parse(sheet_name, usecols=lambda col: col in SHEET_COLUMNS)
 
         df_processed = mut.preprocess_df(df_sheet)
-        processed_data = df_processed.to_dict("index")
+        processed_data = df_to_mice_dict(df_processed)
         
         return processed_data
 
@@ -57,6 +75,7 @@ def write_processed_data_to_excel(excel_file, processed_data):
     Writes processed mouse data to an Excel file.
     This function takes processed mouse data, organizes it, performs a memorial cleanup,
     and then writes the data to the "MDb" sheet in the specified Excel file.
+    The data is converted to a DataFrame once and stays one through to the write.
     The sheet will be autofitted for better readability.
     Args:
         excel_file (str): The path to the Excel file where data will be written.
@@ -64,47 +83,145 @@ def write_processed_data_to_excel(excel_file, processed_data):
     Returns:
         bool: True if the data was successfully written, False otherwise.
     """
-    parental_mice_live, living_mice = parse_mice_data_for_write(processed_data)
-    mice_to_write = memorial_cleanup(processed_data, living_mice, parental_mice_live)
-    sorted_mice = dict(sorted(mice_to_write.items(),key=lambda x: x[1].get("cage")))
-    df_sorted = pd.DataFrame.from_dict(sorted_mice, orient="index")
+    df_mice = mice_dict_to_df(processed_data)
+    parental_mice_live, living_mice = parse_mice_data_for_write(df_mice, processed_data)
+    df_to_write = memorial_cleanup(df_mice, living_mice, parental_mice_live)
+    df_sorted = df_to_write.sort_values("cage", kind="mergesort") # Stable, keeps mice within a cage in their original order
     df_postprocessed = mut.process_df_before_export(df_sorted, DATE_COLUMNS)
 
     try:
-        with pd.ExcelWriter(excel_file, engine="xlsxwriter") as writer:
-            df_postprocessed.to_excel(writer, sheet_name="MDb", index=False)
-            writer.sheets["MDb"].autofit()
+        # constant_memory flushes each row to disk once written instead of holding the whole sheet
+        with pd.ExcelWriter(excel_file, engine="xlsxwriter", engine_kwargs={"options": {"constant_memory": True}}) as writer:
+            write_df_to_sheet(writer, df_postprocessed, "MDb")
             return True
 
     except Exception as e:
         logging.error(f"An error occurred during Excel writing: {e}\n{traceback.format_exc()}")
         return False
+
+def df_to_mice_dict(df):
+    """
+    Converts a DataFrame into the mouse dictionary used throughout the GUI, keyed by the index.
+    Equivalent to df.to_dict("index"), but builds the rows through to_dict("records"),
+    which boxes each cell once without the per-row Series pandas goes through for "index".
+    Args:
+        df (pd.DataFrame): The mouse data, indexed by mouse ID.
+    Returns:
+        dict: A dictionary mapping each index label to a dictionary of that row's values.
+    """
+    return dict(zip(df.index, df.to_dict("records")))
+
+def mice_dict_to_df(mice_dict, columns=None):
+    """
+    Converts a mouse dictionary back into an object-dtype DataFrame indexed by its keys.
+    Equivalent to pd.DataFrame.from_dict(mice_dict, orient="index", dtype=object), but hands the
+    row dictionaries to the DataFrame constructor as a list, which is several times faster.
+    Args:
+        mice_dict (dict): A dictionary mapping mouse IDs to dictionaries of mouse data.
+        columns (list, optional): Only build these columns, missing ones are filled with NaN.
+                                  Defaults to None, which keeps every field.
+    Returns:
+        pd.DataFrame: The mouse data, one row per mouse.
+    """
+    return pd.DataFrame(list(mice_dict.values()), index=list(mice_dict.keys()), columns=columns, dtype=object)
+
+def write_df_to_sheet(writer, df, sheet_name, max_col_width=50):
+    """
+    Writes a DataFrame into a new worksheet row by row with xlsxwriter's write_row.
+    Each column is converted to its cell values once (see excel_cell_values), so cells are
+    typed by their value as with to_excel: numbers stay numbers and strings stay text.
+    Rows are then written in order, one write_row call each, which is what xlsxwriter's
+    constant_memory mode requires. Column widths are fitted from the same data, since
+    worksheet.autofit() is not available in that mode.
+    Args:
+        writer (pd.ExcelWriter): An open ExcelWriter using the xlsxwriter engine.
+        df (pd.DataFrame): The DataFrame to write, header row included, without index.
+        sheet_name (str): The name of the worksheet to create.
+        max_col_width (int, optional): Upper bound for fitted column widths. Defaults to 50.
+    Returns:
+        xlsxwriter.worksheet.Worksheet: The written worksheet.
+    """
+    workbook = writer.book
+    worksheet = workbook.add_worksheet(sheet_name)
+    header_format = workbook.add_format({"bold": True, "border": 1, "align": "center", "valign": "top"})
+
+    headers = [str(col) for col in df.columns]
+    columns = []
+    for col_idx, col in enumerate(df.columns):
+        cell_values = excel_cell_values(df[col])
+        width = max([len(headers[col_idx])] + [len(str(value)) for value in cell_values])
+        worksheet.set_column(col_idx, col_idx, min(width + 2, max_col_width))
+        columns.append(cell_values)
+
+    worksheet.write_row(0, 0, headers, header_format)
+    for row_idx, row_values in enumerate(zip(*columns), start=1):
+        worksheet.write_row(row_idx, 0, row_values)
+    return worksheet
+
+def excel_cell_values(series):
+    """
+    Converts a column into the values written to its cells, typed by value rather than by column.
+    Real numbers are written as numbers, integral floats as ints so that a column read as float
+    because of blanks does not turn 1 into 1.0; booleans stay booleans; missing values become
+    blank cells; anything else (genuine strings included) is written as text.
+    Args:
+        series (pd.Series): The column to convert.
+    Returns:
+        list: The cell values, in row order.
+    """
+    if series.dtype.kind in "iub": # NumPy ints and bools, tolist already yields plain Python values and none are missing
+        return series.tolist()
+    return [excel_cell_value(value) for value in series.tolist()]
+
+def excel_cell_value(value):
+    """Converts a single value for excel_cell_values"""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (bool, np.bool_)):
+        return bool(value)
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    if isinstance(value, (float, np.floating)):
+        if np.isnan(value):
+            return ""
+        if np.isinf(value): # Excel has no infinity, to_excel writes it as text too
+            return str(value)
+        return int(value) if float(value).is_integer() else float(value)
+    if value is None or value is pd.NaT or value is pd.NA:
+        return ""
+    return str(value)
     
 ##########################################################################################################################
 
-def validate_excel(file_path, required_columns=REQUIRED_COLUMNS):
+def validate_excel(file_path, required_columns=REQUIRED_COLUMNS, engine=READ_ENGINE):
     """
     Validates an Excel file to ensure it's a valid .xlsx or .xls file,
     contains an "MDb" sheet, and has all required columns.
+    The workbook is opened only once; the parsed "MDb" sheet is returned so it
+    can be handed straight to data_preprocess without reading the file again.
     Args:
         file_path (str): The path to the Excel file to validate.
         required_columns (list, optional): A list of column names that must be present.
                                            Defaults to REQUIRED_COLUMNS.
+        engine (str, optional): The pandas Excel engine to read with.
+                                Defaults to READ_ENGINE (calamine when installed).
+    Returns:
+        pd.DataFrame: The raw "MDb" sheet.
     Raises:
         Exception: If the file type is invalid, the "MDb" sheet or any required columns are missing.
     """
     if not file_path.lower().endswith((".xlsx", ".xls")):
         raise Exception("Invalid file type - must be .xlsx or .xls")
     # Process all data from MouseDatabase
-    temp_excel = pd.ExcelFile(file_path)
-    if "MDb" not in temp_excel.sheet_names:
-        raise Exception(f"No 'MDb' among sheets in chosen excel file. Check your chosen file.")
-    temp_excel.close()
+    with pd.ExcelFile(file_path, engine=engine) as excel_file_obj:
+        if "MDb" not in excel_file_obj.sheet_names:
+            raise Exception(f"No 'MDb' among sheets in chosen excel file. Check your chosen file.")
+        df = excel_file_obj.parse("MDb", usecols=lambda col: col in SHEET_COLUMNS) # Only materialize the columns we keep
 
-    df = pd.read_excel(file_path, "MDb")
     missing = [col for col in required_columns if col not in df.columns]
     if missing:
         raise Exception(f"Missing required columns {missing}")
+    return df
 
 ##########################################################################################################################
 
@@ -122,25 +239,22 @@ def mice_changelog(old_dict, new_dict, output_path):
         str or False: The path to the generated changelog file if successful, False otherwise.
     """
     try:
-        added_entries, changed_entries = find_changes_for_changelog(old_dict, new_dict)
-        df_added, df_changed, df_manual = organize_changelog_df(added_entries, changed_entries)
+        changes = find_changes_for_changelog(old_dict, new_dict)
+        if not changes: # Nothing to log, don't open a writer at all
+            return False
+        added_ids, changed_ids = changes
+        df_added, df_changed, df_manual = organize_changelog_df(
+            [new_dict[mouse] for mouse in added_ids], [new_dict[mouse] for mouse in changed_ids])
 
         # Generate timestamped filename
         timestamp = datetime.now().strftime("%m%d_%H%M%S")
         log_file = f"{output_path}/mice_changelog_{timestamp}.xlsx"
 
-        # Save to Excel
-        with pd.ExcelWriter(log_file, engine="xlsxwriter") as writer:
-            if not df_manual.empty:
-                df_manual.to_excel(writer, sheet_name="Manual", index=False)
-            if not df_added.empty:
-                df_added.to_excel(writer, sheet_name="Added", index=False)
-            if not df_changed.empty:
-                df_changed.to_excel(writer, sheet_name="Changed", index=False)
-
-            for sheet_name in writer.sheets:
-                worksheet = writer.sheets[sheet_name]
-                worksheet.autofit()
+        # Save to Excel, streamed row by row like the MDb sheet
+        with pd.ExcelWriter(log_file, engine="xlsxwriter", engine_kwargs={"options": {"constant_memory": True}}) as writer:
+            for sheet_name, df_sheet in (("Manual", df_manual), ("Added", df_added), ("Changed", df_changed)):
+                if df_sheet is not None and not df_sheet.empty:
+                    write_df_to_sheet(writer, df_sheet, sheet_name)
 
         logging.info(f"Log saved to: {log_file}")
         return log_file
@@ -148,7 +262,7 @@ def mice_changelog(old_dict, new_dict, output_path):
         logging.error(f"Error building changelog: {e}\n{traceback.format_exc()}")
     return False
 
-def changelog_loader(changelog_file_path, mice_dict, changelog_sheets=CHANGELOG_SHEETS):
+def changelog_loader(changelog_file_path, mice_dict, changelog_sheets=CHANGELOG_SHEETS, engine=READ_ENGINE):
     """
     Loads changes from a changelog Excel file and applies them to the main mice dictionary.
     This function reads "Added" and "Changed" sheets from the changelog file,
@@ -159,6 +273,8 @@ def changelog_loader(changelog_file_path, mice_dict, changelog_sheets=CHANGELOG_
         mice_dict (dict): The main dictionary containing mouse data to be updated.
         changelog_sheets (list, optional): A list of sheet names to process.
                                            Defaults to CHANGELOG_SHEETS.
+        engine (str, optional): The pandas Excel engine to read with.
+                                Defaults to READ_ENGINE (calamine when installed).
     Returns:
         tuple: A tuple containing:
                - str: A message summarizing the applied changes.
@@ -168,13 +284,14 @@ def changelog_loader(changelog_file_path, mice_dict, changelog_sheets=CHANGELOG_
     """
     # Read sheets for Added and Changed mice from the changelog file
     changelog_dfs = {}
-    for sheet_name in changelog_sheets:
-        try:
-            df = pd.read_excel(changelog_file_path, sheet_name=sheet_name)
-            if not df.empty:
-                changelog_dfs[sheet_name] = df
-        except:
-            continue  # Skip if sheet doesn"t exist
+    with pd.ExcelFile(changelog_file_path, engine=engine) as changelog_file_obj: # Unpacked once for all sheets
+        for sheet_name in changelog_sheets:
+            try:
+                df = changelog_file_obj.parse(sheet_name, dtype=object) # Text cells stay text, "7260..." IDs are not inferred as numbers
+                if not df.empty:
+                    changelog_dfs[sheet_name] = df
+            except:
+                continue  # Skip if sheet doesn"t exist
     if not changelog_dfs:
         raise Exception("The selected changelog file is empty or has no valid sheets.")
     
@@ -267,6 +384,9 @@ def load_changelog_change(changelog_df, mice_dict, changes_applied_count, except
 def find_changes_for_changelog(old_dict, new_dict, fields_to_compare=COMPARE_COLUMNS, check_only=False):
     """
     Compares two mouse data dictionaries to identify added and changed entries for a changelog.
+    Both are aligned by mouse key in DataFrames and compared column-wise; a field missing
+    in both is treated as unchanged. With check_only, the dictionaries are compared entry by
+    entry instead, returning on the first difference.
     Args:
         old_dict (dict): The dictionary representing the old mouse data.
         new_dict (dict): The dictionary representing the new mouse data.
@@ -281,31 +401,38 @@ def find_changes_for_changelog(old_dict, new_dict, fields_to_compare=COMPARE_COL
                        - list: IDs of added mice.       - list: IDs of changed mice.
                        Returns False if no changes are found and `check_only` is False.
     """
-    added, changed = [], []
-    for mouse in new_dict:
-        if mouse not in old_dict:
-            if check_only:
-                return True
-            else:
-                added.append(mouse)
-        elif any(new_dict[mouse].get(f) != old_dict[mouse].get(f) for f in fields_to_compare):
-            if check_only:
-                return True
-            else:
-                changed.append(mouse)
-
+    if check_only: # Called after every edit, so stop at the first difference instead of diffing everything
+        if new_dict.keys() - old_dict.keys():
+            return True
+        return any(field_changed(new_info.get(field), old_dict[mouse_id].get(field))
+                   for mouse_id, new_info in new_dict.items() for field in fields_to_compare)
+
+    # Align both datasets by mouse key once and compare every field column-wise
+    df_old = mice_dict_to_df(old_dict, fields_to_compare)
+    df_new = mice_dict_to_df(new_dict, fields_to_compare)
+    added_mask = ~df_new.index.isin(df_old.index)
+    df_old = df_old.reindex(df_new.index)
+    differs = df_new.ne(df_old) & ~(df_new.isna() & df_old.isna()) # A field missing on both sides is not a change
+    changed_mask = ~added_mask & differs.any(axis=1).to_numpy()
+
+    added, changed = df_new.index[added_mask].tolist(), df_new.index[changed_mask].tolist()
     if not added and not changed:
         logging.info("No changes found.")
         return False
     else:
         return added, changed
     
+def field_changed(new_value, old_value):
+    """Single-field version of the column-wise comparison in find_changes_for_changelog, a value missing on both sides is not a change"""
+    return bool(new_value != old_value) and not (pd.isna(new_value) and pd.isna(old_value))
+
 def organize_changelog_df(added_entries, changed_entries, fields_to_keep=KEEP_COLUMNS, manual_cols=MANUAL_COLUMNS, date_cols=DATE_COLUMNS):
     """
     Organizes added and changed mouse entries into DataFrames for changelog generation.
     This function takes lists of added and changed mouse entries, converts them into
     Pandas DataFrames, formats date columns, and identifies entries requiring manual
-    review (where 'nuCA' and 'cage' differ).
+    review (where 'nuCA' and 'cage' differ). Only the kept columns are materialized,
+    and the manual review rows are selected before any date formatting.
     Args:
         added_entries (list): A list of dictionaries for newly added mice.
         changed_entries (list): A list of dictionaries for changed mice.
@@ -323,77 +450,83 @@ def organize_changelog_df(added_entries, changed_entries, fields_to_keep=KEEP_CO
     """
     df_added, df_changed, df_manual = None, None, None
     if added_entries:
-        df_added = mut.df_date_col_formatter(pd.DataFrame(added_entries).loc[:, fields_to_keep], date_cols)
+        df_added = mut.df_date_col_formatter(pd.DataFrame(added_entries, columns=fields_to_keep), date_cols)
     if changed_entries:
-        df_changed_temp = pd.DataFrame(changed_entries).loc[:, fields_to_keep]
-        df_changed = mut.df_date_col_formatter(df_changed_temp, date_cols)
-        df_manual = df_changed_temp.loc[df_changed_temp["nuCA"] != df_changed_temp["cage"], manual_cols]
+        df_changed = pd.DataFrame(changed_entries, columns=list(dict.fromkeys(fields_to_keep + manual_cols)))
+        manual_mask = df_changed["nuCA"] != df_changed["cage"]
+        df_manual = mut.df_date_col_formatter(df_changed.loc[manual_mask, manual_cols], date_cols)
+        df_changed = mut.df_date_col_formatter(df_changed.loc[:, fields_to_keep], date_cols)
     return df_added, df_changed, df_manual
 
 ##########################################################################################################################
 
-def parse_mice_data_for_write(processed_data):
+def parse_mice_data_for_write(df_mice, processed_data=None):
     """
     Parses processed mouse data to identify parental mice and living mice for writing.
-    This function iterates through the processed mouse data, updates "Death Row" mice
-    to "Memorial" category, handles `breedDate` for "BACKUP" and non-"BACKUP" mice,
-    and populates sets of living mice and parental mice that have living offspring.
+    This function updates "Death Row" mice to "Memorial" category, handles `breedDate`
+    for "BACKUP" and non-"BACKUP" mice, and collects sets of living mice and parental mice
+    that have living offspring. All updates are applied column-wise on `df_mice`.
     Args:
-        processed_data (dict): A dictionary containing the processed mouse data.
+        df_mice (pd.DataFrame): The processed mouse data, indexed by mouse ID. Updated in place.
+        processed_data (dict, optional): The dictionary `df_mice` was built from. The updated
+                                         fields are mirrored back into it, as the GUI keeps
+                                         working on it after saving. Defaults to None.
     Returns:
         tuple: A tuple containing two sets:
                - parental_mice_live (set): IDs of parental mice with living offspring.
                - living_mice (set): IDs of all living mice.
     """
-    parental_mice, parental_mice_live, living_mice = set(), set(), set()
-    for mouse_id, mouse_info in processed_data.items():
-        if mouse_info.get("nuCA") == "Death Row":
-            logging.info(f"Death Row mouse {mouse_id} transfer to Memorial")
-            mouse_info["nuCA"] = "Memorial"
-            mouse_info["category"] = "Memorial"
-        if mouse_info.get("category") == "BACKUP": # Remove breedDate for non-breeding ( BACKUP ) mice
-            mouse_info["breedDate"] = None
-            mouse_info["breedDays"] = None
-        elif mouse_info.get("category") != "BACKUP":  # Set nearest breedDate to today for newly introduced breeding mice
-            breed_date = mouse_info.get("breedDate")
-            if isinstance(breed_date, str):
-                breed_date = pd.to_datetime(breed_date, errors="coerce", yearfirst=True, format="%y-%m-%d")
-            if pd.isna(breed_date):
-                mouse_info["breedDate"] = date.today()
-                mouse_info["breedDays"] = 0
-        current_parental_mice = mouse_info["parentF"] + mouse_info["parentM"]
-        parental_mice.add(current_parental_mice)
-        if mouse_info["category"] != "Memorial":
-            parental_mice_live.add(current_parental_mice)
-            living_mice.add(mouse_info["ID"])
+    death_row_mask = df_mice["nuCA"] == "Death Row"
+    for mouse_id in df_mice.index[death_row_mask]:
+        logging.info(f"Death Row mouse {mouse_id} transfer to Memorial")
+    df_mice.loc[death_row_mask, ["nuCA", "category"]] = "Memorial"
+
+    backup_mask = df_mice["category"] == "BACKUP" # Remove breedDate for non-breeding ( BACKUP ) mice
+    df_mice.loc[backup_mask, ["breedDate", "breedDays"]] = None
+
+    # Set nearest breedDate to today for newly introduced breeding mice
+    breed_dates = df_mice["breedDate"]
+    is_str_date = breed_dates.map(lambda bd: isinstance(bd, str))
+    parsed_dates = pd.to_datetime(breed_dates.where(is_str_date), errors="coerce", yearfirst=True, format="%y-%m-%d")
+    no_breed_date_mask = ~backup_mask & (breed_dates.isna() | (is_str_date & parsed_dates.isna()))
+    df_mice.loc[no_breed_date_mask, "breedDate"] = date.today()
+    df_mice.loc[no_breed_date_mask, "breedDays"] = 0
+
+    if processed_data is not None:
+        updated_cols = ["nuCA", "category", "breedDate", "breedDays"]
+        updated_mask = death_row_mask | backup_mask | no_breed_date_mask
+        for mouse_id, updated_info in df_mice.loc[updated_mask, updated_cols].to_dict("index").items():
+            processed_data[mouse_id].update(updated_info)
+
+    living_mask = df_mice["category"] != "Memorial"
+    living_mice = set(df_mice.loc[living_mask, "ID"])
+    parental_mice_live = set(df_mice.loc[living_mask, "parentF"]) | set(df_mice.loc[living_mask, "parentM"])
     return parental_mice_live, living_mice
 
-def memorial_cleanup(processed_data, living_mice, parental_mice_live):
+def memorial_cleanup(df_mice, living_mice, parental_mice_live):
     """
     Performs a cleanup of "Memorial" mice based on age, living parents, and living offspring.
     Mice in the "Memorial" category that are older than 365 days, have no living parents,
     and are not parents of any living mice will be excluded from the data to be written.
     For other mice, the 'cage' field is updated to match 'nuCA'.
     Args:
-        processed_data (dict): The dictionary containing all processed mouse data.
+        df_mice (pd.DataFrame): The processed mouse data, indexed by mouse ID.
         living_mice (set): A set of IDs of all currently living mice.
         parental_mice_live (set): A set of IDs of parental mice with living offspring.
     Returns:
-        dict: A new dictionary containing mouse data after the memorial cleanup,
-              ready for writing to Excel.
-    """
-    mice_to_write = {}
-    for mouse_id, mouse_info in processed_data.items():
-        isAncient = mouse_info["age"] > 365
-        hasLivingParent = mouse_info["parentF"] in living_mice or mouse_info["parentM"] in living_mice
-        isParent = mouse_info["ID"] in parental_mice_live # is parent of still living mice
-        if mouse_info.get("nuCA") == "Memorial" and isAncient and not hasLivingParent and not isParent:
-            logging.info(f"Cleaned up mouse {mouse_id}, which has no living parents or children and is born more than 365 days ago.")
-            continue
-        cleaned_mouse_info = mouse_info.copy()
-        cleaned_mouse_info["cage"] = cleaned_mouse_info["nuCA"]
-        mice_to_write[mouse_id] = cleaned_mouse_info
-    return mice_to_write
+        pd.DataFrame: A new DataFrame containing mouse data after the memorial cleanup,
+                      ready for writing to Excel.
+    """
+    is_ancient = pd.to_numeric(df_mice["age"], errors="coerce") > 365
+    has_living_parent = df_mice["parentF"].isin(living_mice) | df_mice["parentM"].isin(living_mice)
+    is_parent = df_mice["ID"].isin(parental_mice_live) # is parent of still living mice
+    cleanup_mask = (df_mice["nuCA"] == "Memorial") & is_ancient & ~has_living_parent & ~is_parent
+    for mouse_id in df_mice.index[cleanup_mask]:
+        logging.info(f"Cleaned up mouse {mouse_id}, which has no living parents or children and is born more than 365 days ago.")
+
+    df_to_write = df_mice.loc[~cleanup_mask].copy()
+    df_to_write["cage"] = df_to_write["nuCA"]
+    return df_to_write
 
 ##########################################################################################################################
 
@@ -401,19 +534,168 @@ def create_backup(excel_file):
     """
     Creates a timestamped backup copy of the original Excel file.
     The backup file will be named with the original filename appended with "_BACKUP_"
-    and the current time (HH-MM-SS).
+    and the current date and time down to microseconds (YYYYMMDD-HHMMSS-ffffff).
+    If an existing backup already has the same modification time and size as the
+    original, that backup is reused instead of copying the file again.
     Args:
         excel_file (str): The path to the original Excel file to be backed up.
     Returns:
         str or None: The path to the created backup file if successful, None otherwise.
     """
-    current_time = datetime.now().time()
-    formatted_time = current_time.strftime("%H-%M-%S")
+    formatted_time = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
     excel_filename = excel_file.removesuffix(".xlsx")
     backup_file = f"{excel_filename}_BACKUP_{formatted_time}.xlsx"
     try:
+        excel_stat = os.stat(excel_file)
+        for existing_backup in glob.glob(f"{glob.escape(excel_filename)}_BACKUP_*.xlsx"):
+            backup_stat = os.stat(existing_backup)
+            if (backup_stat.st_mtime, backup_stat.st_size) == (excel_stat.st_mtime, excel_stat.st_size): # copy2 keeps the mtime
+                logging.info(f"Reusing existing backup {existing_backup}, original file unchanged since.")
+                return existing_backup
         shutil.copy2(excel_file, backup_file)
         return backup_file
     except FileNotFoundError:
         logging.error(f"Error: Original file '{excel_file}' not found. Cannot create backup.")
-        return None
\ No newline at end of file
+        return None
+
+##########################################################################################################################
+
+def load_preprocess_cache(excel_file, required_columns=REQUIRED_COLUMNS):
+    """
+    Loads previously preprocessed mouse data for an Excel file from the per-user cache.
+    The cache is JSON, so reading it can never run code, and an entry is only trusted when it
+    was made from the exact same file (path, size, modification time and SHA-256 of its content),
+    by the same version of the processing code, on the same day (ages are relative to today).
+    Entries are only ever written for sheets that passed validate_excel; as the content hash
+    ties the entry to that file, its mice are only checked for the required columns here.
+    Args:
+        excel_file (str): The path to the Excel file.
+        required_columns (list, optional): Fields every cached mouse must carry.
+                                           Defaults to REQUIRED_COLUMNS.
+    Returns:
+        dict or None: The cached processed data, or None if there is no valid cache.
+    """
+    try:
+        cache_file = get_preprocess_cache_path(excel_file)
+        if not os.path.exists(cache_file):
+            return None
+        with open(cache_file, "r", encoding="utf-8") as f:
+            cache_entry = json.load(f, object_hook=decode_cache_value)
+        if not isinstance(cache_entry, dict) or cache_entry.get("key") != get_preprocess_cache_key(excel_file):
+            logging.info(f"Preprocess cache for '{excel_file}' is stale, reading the file instead.")
+            return None
+        processed_data = {}
+        for mouse_id, mouse_info in cache_entry["mice"]:
+            if not isinstance(mouse_info, dict) or any(col not in mouse_info for col in required_columns):
+                raise ValueError(f"Cached mouse {mouse_id} is missing required columns")
+            processed_data[mouse_id] = mouse_info
+        logging.info(f"Loaded preprocessed data from cache: {cache_file}")
+        return processed_data
+    except Exception as e:
+        logging.warning(f"Failed to load preprocess cache for '{excel_file}': {e}")
+        return None
+
+def save_preprocess_cache(excel_file, processed_data):
+    """
+    Saves preprocessed mouse data to the per-user cache, replacing the previous entry of the same file.
+    The entry is written to a temporary file first and then moved in place, so a reader never sees half of it.
+    Args:
+        excel_file (str): The path to the Excel file the data was read from.
+        processed_data (dict): The processed mouse data.
+    Returns:
+        str or None: The path to the cache file if successful, None otherwise.
+    """
+    temp_file = None
+    try:
+        cache_file = get_preprocess_cache_path(excel_file)
+        cache_entry = {"key": get_preprocess_cache_key(excel_file), "mice": list(processed_data.items())} # Pairs keep non-string mouse keys intact
+        temp_file = f"{cache_file}.{os.getpid()}.tmp"
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump(cache_entry, f, default=encode_cache_value)
+        os.replace(temp_file, cache_file)
+        return cache_file
+    except Exception as e:
+        logging.warning(f"Failed to save preprocess cache for '{excel_file}': {e}")
+        if temp_file and os.path.exists(temp_file):
+            os.remove(temp_file)
+        return None
+
+def get_preprocess_cache_path(excel_file):
+    """
+    Builds the cache file path for an Excel file, one entry per workbook keyed by its absolute path.
+    Args:
+        excel_file (str): The path to the Excel file.
+    Returns:
+        str: The path to the cache file in the per-user cache directory.
+    """
+    path_digest = hashlib.sha256(os.path.abspath(excel_file).encode()).hexdigest()[:16]
+    return os.path.join(get_preprocess_cache_dir(), f"mdb_cache_{path_digest}.json")
+
+def get_preprocess_cache_key(excel_file):
+    """
+    Describes what a cache entry was made from: the file (absolute path, size, modification time
+    and content hash), the modification time of the processing code and today's date.
+    Args:
+        excel_file (str): The path to the Excel file.
+    Returns:
+        dict: The cache key, stored in and compared against every cache entry.
+    """
+    abspath = os.path.abspath(excel_file)
+    file_stat = os.stat(abspath)
+    content_hash = hashlib.sha256()
+    with open(abspath, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            content_hash.update(chunk)
+    return {
+        "path": abspath, "size": file_stat.st_size, "mtime_ns": file_stat.st_mtime_ns, "sha256": content_hash.hexdigest(),
+        "code_mtime": max(os.path.getmtime(__file__), os.path.getmtime(mut.__file__)), "day": date.today().isoformat(),
+    }
+
+def get_preprocess_cache_dir():
+    """
+    Returns the per-user directory holding preprocess caches, created readable and writable
+    by the current user only (XDG_CACHE_HOME or ~/.cache, LOCALAPPDATA on Windows).
+    Returns:
+        str: The path to the cache directory.
+    Raises:
+        OSError: If the directory belongs to another user.
+    """
+    if os.name == "nt":
+        base_dir = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    else:
+        base_dir = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    cache_dir = os.path.join(base_dir, "MouseSheetDB")
+    os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+    if os.name != "nt":
+        dir_stat = os.lstat(cache_dir)
+        if not stat.S_ISDIR(dir_stat.st_mode) or dir_stat.st_uid != os.getuid():
+            raise OSError(f"Cache directory '{cache_dir}' does not belong to the current user")
+        if dir_stat.st_mode & 0o077: # Created earlier with a looser umask
+            os.chmod(cache_dir, 0o700)
+    return cache_dir
+
+def encode_cache_value(value):
+    """JSON encoder fallback for the cache, dates are tagged so they can be told apart from strings and come back as the same type"""
+    if value is pd.NaT: # A datetime instance itself, so it must be caught before the date branches
+        return {"__nat__": True}
+    if isinstance(value, pd.Timestamp): # Dates of datetime64 columns, as the reader leaves them
+        return {"__timestamp__": value.isoformat()}
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, date):
+        return {"__date__": value.isoformat()}
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Cannot cache value {value!r} of type {type(value).__name__}")
+
+def decode_cache_value(obj):
+    """JSON object hook for the cache, the reverse of encode_cache_value"""
+    if obj.keys() == {"__date__"}:
+        return date.fromisoformat(obj["__date__"])
+    if obj.keys() == {"__datetime__"}:
+        return datetime.fromisoformat(obj["__datetime__"])
+    if obj.keys() == {"__timestamp__"}:
+        return pd.Timestamp(obj["__timestamp__"])
+    if obj.keys() == {"__nat__"}:
+        return pd.NaT
+    return obj
@@ -1,7 +1,10 @@
 from PySide6.QtWidgets import QWidget, QVBoxLayout
 
+import numpy as np
+import pandas as pd
+
+from matplotlib.figure import Figure
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-import matplotlib.pyplot as plt
 
 import logging
 import warnings
@@ -35,37 +38,32 @@ class MousePlotter(QWidget):
             logging.error(f"Error processing mouse data for genotype bar plot: {e}", exc_info=True)
             return False
 
-        fig, axes = plt.subplots(1, 1, figsize=(8, 6))
-        ax = axes
-        ax.bar(self.genotypes, self.male_counts, label="♂", color="lightblue")
-        ax.bar(self.genotypes, self.female_counts, bottom=self.male_counts, label="♀", color="lightpink")
-        ax.bar(self.genotypes, self.senile_counts, bottom=[self.male_counts[j] + self.female_counts[j] for j in range(len(self.genotypes))], label="Senile", color="grey")
-
-        for j, genotype in enumerate(self.genotypes):
-            male_y = self.male_counts[j] / 2
-            female_y = self.male_counts[j] + (self.female_counts[j] / 2)
-            senile_y = self.male_counts[j] + self.female_counts[j] + (self.senile_counts[j] / 2)
-
-            if self.male_counts[j] > 0:
-                ax.text(genotype, male_y, str(self.male_counts[j]), ha="center", va="center", color="black")
-            if self.female_counts[j] > 0:
-                ax.text(genotype, female_y, str(self.female_counts[j]), ha="center", va="center", color="black")
-            if self.senile_counts[j] > 0:
-                ax.text(genotype, senile_y, str(self.senile_counts[j]), ha="center", va="center", color="black")
+        if self.mpl_canvas is None:
+            fig = Figure(figsize=(8, 6)) # Owned by the canvas alone, never enters pyplot's global figure registry
+            self.ax = fig.add_subplot(111)
+            self.mpl_canvas = FigureCanvas(fig)
+            self.main_layout.addWidget(self.mpl_canvas) # Add canvas to the layout
+        else: # Redraw into the figure and canvas already on screen instead of building new ones
+            self.ax.clear()
+        ax = self.ax
+        ticks = np.arange(len(self.genotypes)) # One bar per genotype, in the order they were counted
+        male_bars = ax.bar(ticks, self.male_counts, label="♂", color="lightblue")
+        female_bars = ax.bar(ticks, self.female_counts, bottom=self.male_counts, label="♀", color="lightpink")
+        senile_bars = ax.bar(ticks, self.senile_counts, bottom=np.add(self.male_counts, self.female_counts), label="Senile", color="grey")
+
+        for bars, counts in ((male_bars, self.male_counts), (female_bars, self.female_counts), (senile_bars, self.senile_counts)):
+            ax.bar_label(bars, labels=[str(count) if count > 0 else "" for count in counts], label_type="center", color="black") # Empty segments stay unlabelled
 
         ax.set_title(f"Genotype Counts in Category: {self.current_category}")
         ax.set_xlabel("Genotype")
         ax.set_ylabel("Number of Mice")
         ax.legend()
-        labels = [label.get_text().replace("-P", "\nP") for label in ax.get_xticklabels()]
-        ax.set_xticks(ax.get_xticks())
-        ax.set_xticklabels(labels)
-
-        plt.tight_layout()
-        canvas = FigureCanvas(fig)
-        self.main_layout.addWidget(canvas) # Add canvas to the layout
-        canvas.draw()
-        self.canvas_widget = canvas # Store the FigureCanvas object
+        ax.set_xticks(ticks)
+        ax.set_xticklabels([str(genotype).replace("-P", "\nP") for genotype in self.genotypes])
+
+        self.mpl_canvas.figure.tight_layout()
+        self.mpl_canvas.draw()
+        self.canvas_widget = self.mpl_canvas # Store the FigureCanvas object
         return self.canvas_widget
 
     def mice_count_for_genotype(self):
@@ -79,29 +77,19 @@ class MousePlotter(QWidget):
         logging.debug(f"DEBUG: first five entries in self.mouseDB: {list(self.mouseDB.items())[:5]}")
         logging.debug(f"DEBUG: current_category: {self.current_category}")
 
-        for mouse_info in self.mouseDB.values():
-            # Only consider mice in the current category for genotype counts
-            if mouse_info.get("category") == self.current_category and mouse_info.get("genotype") not in self.genotypes:
-                self.genotypes.append(mouse_info.get("genotype"))
-            
-        for genotype in self.genotypes:
-            males = sum(1 for mouse_info in self.mouseDB.values()
-                            if mouse_info.get("genotype") == genotype
-                            and mouse_info.get("category") == self.current_category
-                            and mouse_info.get("sex") == "♂"
-                            and mouse_info.get("age", 0) <= 300)
-            females = sum(1 for mouse_info in self.mouseDB.values()
-                            if mouse_info.get("genotype") == genotype
-                            and mouse_info.get("category") == self.current_category
-                            and mouse_info.get("sex") == "♀"
-                            and mouse_info.get("age", 0) <= 300)
-            seniles = sum(1 for mouse_info in self.mouseDB.values()
-                            if mouse_info.get("genotype") == genotype
-                            and mouse_info.get("category") == self.current_category
-                            and mouse_info.get("age", 0) > 300)
-            self.male_counts.append(males)
-            self.female_counts.append(females)
-            self.senile_counts.append(seniles)
+        df_category = pd.DataFrame(self.gui.get_category_mice(self.current_category), columns=["genotype", "sex", "age"])
+        if df_category.empty:
+            self.genotypes, self.male_counts, self.female_counts, self.senile_counts = [], [], [], [] # Drop the counts of a previous draw
+            return
+        ages = pd.to_numeric(df_category["age"], errors="coerce")
+        is_senile, is_young = (ages > 300).to_numpy(), (ages <= 300).to_numpy() # Mice without an age are neither
+        sexes = df_category["sex"].to_numpy()
+        codes, genotypes = pd.factorize(df_category["genotype"], use_na_sentinel=False) # Genotype codes in first-seen order
+
+        self.genotypes = list(genotypes)
+        self.male_counts = np.bincount(codes[(sexes == "♂") & is_young], minlength=len(genotypes)).tolist()
+        self.female_counts = np.bincount(codes[(sexes == "♀") & is_young], minlength=len(genotypes)).tolist()
+        self.senile_counts = np.bincount(codes[is_senile], minlength=len(genotypes)).tolist()
 
     #########################################################################################################################
 
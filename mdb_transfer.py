@@ -22,8 +22,25 @@ class MouseTransfer(QDialog):
         self.mice_status = mice_status
 
         self.selected_mouse = None
+        # Both dialogs are built on first use and reused by later transfers
+        self.existing_cage_dialog = None
+        self.cage_dropdown = None
+        self.new_cage_dialog = None
+        self.prefix_label = None
         self.new_cage_entry = None
 
+    def retarget(self, mouseDB, current_category, mice_status):
+        """
+        Points a reused MouseTransfer at the data currently on display.
+        Args:
+            mouseDB: The mouse database object.
+            current_category (str): The current category of mice being displayed.
+            mice_status: An object containing dictionaries of mice categorized by their status (regular, waiting, death).
+        """
+        self.mouseDB = mouseDB
+        self.current_category = current_category
+        self.mice_status = mice_status
+
     def transfer_to_existing_cage(self):
         """
         Initiates the process to transfer a selected mouse to an existing cage.
@@ -32,32 +49,34 @@ class MouseTransfer(QDialog):
         logging.debug(f"TRANSFER: transfer_to_existing_cage called for mouse ID: {self.gui.selected_mouse.get('ID')}")
         self.selected_mouse = self.gui.selected_mouse # Ensure we are working with the currently selected mouse from GUI
         if self.selected_mouse is not None:
-            dialog = QDialog(self) # Parent is self (MouseTransfer dialog)
-            dialog.setWindowTitle("Select Target Cage")
-            dialog.setModal(True) # Make it modal
-            dialog.setGeometry(100, 300, 300, 150) # x, y, width, height (adjust as needed)
-
-            layout = QtWidgets.QVBoxLayout(dialog)
-            layout.addWidget(QLabel("Select a cage:"))
-
             current_cage = self.selected_mouse.get("nuCA")
             existing_cages = sorted([c for c in self.mice_status.regular if c != current_cage])
 
             if not existing_cages:
                 logging.debug("No other existing cages available for transfer.")
-                QMessageBox.information(dialog, "No Cages", "No other existing cages available for transfer.")
-                dialog.close()
+                QMessageBox.information(self, "No Cages", "No other existing cages available for transfer.")
                 return
 
-            cage_dropdown = QtWidgets.QComboBox()
-            cage_dropdown.addItems(existing_cages)
-            layout.addWidget(cage_dropdown)
+            if self.existing_cage_dialog is None:
+                dialog = QDialog(self) # Parent is self (MouseTransfer dialog)
+                dialog.setWindowTitle("Select Target Cage")
+                dialog.setModal(True) # Make it modal
+                dialog.setGeometry(100, 300, 300, 150) # x, y, width, height (adjust as needed)
 
-            transfer_button = QPushButton("Transfer")
-            transfer_button.clicked.connect(lambda: self.confirm_transfer(dialog, cage_dropdown.currentText()))
-            layout.addWidget(transfer_button)
+                layout = QtWidgets.QVBoxLayout(dialog)
+                layout.addWidget(QLabel("Select a cage:"))
+
+                self.cage_dropdown = QtWidgets.QComboBox()
+                layout.addWidget(self.cage_dropdown)
 
-            dialog.exec() # Show as modal dialog
+                transfer_button = QPushButton("Transfer")
+                transfer_button.clicked.connect(lambda: self.confirm_transfer(dialog, self.cage_dropdown.currentText()))
+                layout.addWidget(transfer_button)
+                self.existing_cage_dialog = dialog
+
+            self.cage_dropdown.clear()
+            self.cage_dropdown.addItems(existing_cages)
+            self.existing_cage_dialog.exec() # Show as modal dialog
         self._cleanup_post_transfer()
 
     def transfer_to_waiting_room(self):
@@ -70,18 +89,9 @@ class MouseTransfer(QDialog):
         if self.selected_mouse is not None:
             logging.debug(f"TRANSFER: Before modification - Regular: {len(self.mice_status.regular)}, Waiting: {len(self.mice_status.waiting)}, Death: {len(self.mice_status.death)}")
             logging.debug(f"Attempting to transfer mouse {self.selected_mouse} to Waiting Room.")
-            current_cage = self.selected_mouse.get("nuCA")
-            if current_cage and current_cage in self.mice_status.regular:
-                mice_list = self.mice_status.regular[current_cage]
-                if self.selected_mouse in mice_list:
-                    mice_list.remove(self.selected_mouse)
-                    logging.debug(f"TRANSFER: Removed mouse {self.selected_mouse} from regular cage {current_cage}.")
-                    if not mice_list:
-                        del self.mice_status.regular[current_cage]
-                        logging.debug(f"TRANSFER: Deleted empty regular cage {current_cage}.")
-
-            if self.selected_mouse["ID"] in self.mice_status.death:
-                del self.mice_status.death[self.selected_mouse["ID"]]
+            self._remove_from_cage()
+
+            if self._remove_from_dict("death"):
                 logging.debug(f"Removed mouse from death row.")
 
             self.selected_mouse["nuCA"] = "Waiting Room"
@@ -98,35 +108,35 @@ class MouseTransfer(QDialog):
         """
         logging.debug(f"TRANSFER: transfer_to_new_cage called for mouse ID: {self.gui.selected_mouse.get('ID')}")
         self.selected_mouse = self.gui.selected_mouse # Ensure we are working with the currently selected mouse from GUI
-        dialog = QDialog(self) # Parent is self (MouseTransfer dialog)
-        dialog.setWindowTitle("Enter New Cage Number")
-        dialog.setModal(True)
-        dialog.setGeometry(100, 300, 300, 150)
+        if self.new_cage_dialog is None:
+            dialog = QDialog(self) # Parent is self (MouseTransfer dialog)
+            dialog.setWindowTitle("Enter New Cage Number")
+            dialog.setModal(True)
+            dialog.setGeometry(100, 300, 300, 150)
 
-        layout = QtWidgets.QVBoxLayout(dialog)
-        layout.addWidget(QLabel("Enter the new cage number:"))
+            layout = QtWidgets.QVBoxLayout(dialog)
+            layout.addWidget(QLabel("Enter the new cage number:"))
 
-        prefix = ""
-        if self.current_category == "NEX + PP2A":
-            prefix = "2-A-"
-        elif self.current_category == "CMV + PP2A":
-            prefix = "8-A-"
-        logging.debug(f"New cage prefix: {prefix}")
+            self.prefix_label = QLabel()
+            self.new_cage_entry = QtWidgets.QLineEdit()
+            
+            input_layout = QtWidgets.QHBoxLayout()
+            input_layout.addWidget(self.prefix_label)
+            input_layout.addWidget(self.new_cage_entry)
+            layout.addLayout(input_layout)
 
-        prefix_label = QLabel(prefix)
-        self.new_cage_entry = QtWidgets.QLineEdit()
-        
-        input_layout = QtWidgets.QHBoxLayout()
-        input_layout.addWidget(prefix_label)
-        input_layout.addWidget(self.new_cage_entry)
-        layout.addLayout(input_layout)
+            transfer_button = QPushButton("Transfer")
+            transfer_button.clicked.connect(lambda: self.validate_and_transfer(dialog))
+            layout.addWidget(transfer_button)
+            self.new_cage_dialog = dialog
 
-        transfer_button = QPushButton("Transfer")
-        transfer_button.clicked.connect(lambda: self.validate_and_transfer(dialog))
-        layout.addWidget(transfer_button)
+        prefix = next((cage_prefix for cage_prefix, category in mut.CAGE_PREFIX_CATEGORIES.items() if category == self.current_category), "")
+        logging.debug(f"New cage prefix: {prefix}")
+        self.prefix_label.setText(prefix)
+        self.new_cage_entry.clear() # Drop what was typed for the previous transfer
 
         self.new_cage_entry.setFocus() # Set focus to the entry widget
-        dialog.exec() # Show as modal dialog
+        self.new_cage_dialog.exec() # Show as modal dialog
 
     def transfer_to_death_row(self):
         """
@@ -138,15 +148,7 @@ class MouseTransfer(QDialog):
         if self.selected_mouse is not None:
             logging.debug(f"TRANSFER: Before modification - Regular: {len(self.mice_status.regular)}, Waiting: {len(self.mice_status.waiting)}, Death: {len(self.mice_status.death)}")
             logging.debug(f"Attempting to transfer mouse {self.selected_mouse} to Death Row.")
-            current_cage = self.selected_mouse.get("nuCA")
-            if current_cage and current_cage in self.mice_status.regular:
-                mice_list = self.mice_status.regular[current_cage]
-                if self.selected_mouse in mice_list:
-                    mice_list.remove(self.selected_mouse)
-                    logging.debug(f"TRANSFER: Removed mouse {self.selected_mouse} from regular cage {current_cage}.")
-                    if not mice_list:
-                        del self.mice_status.regular[current_cage]
-                        logging.debug(f"TRANSFER: Deleted empty regular cage {current_cage}.")
+            self._remove_from_cage()
 
             self._remove_from_dict("waiting")
             logging.debug(f"Removed mouse from waiting room dict (if present).")
@@ -178,10 +180,7 @@ class MouseTransfer(QDialog):
             logging.debug(f"Mouse {self.selected_mouse.get('ID')} restored to original cage {original_cage} and category {self.selected_mouse['category']}.")
 
             if self.selected_mouse["category"] == self.current_category:
-                if original_cage not in self.mice_status.regular:
-                    self.mice_status.regular[original_cage] = []
-                    logging.debug(f"TRANSFER: Created new regular cage entry for {original_cage}.")
-                self.mice_status.regular[original_cage].append(self.selected_mouse)
+                self.mice_status.regular.setdefault(original_cage, []).append(self.selected_mouse) # Creates the cage entry if it is new
                 logging.debug(f"TRANSFER: Mouse {self.selected_mouse.get('ID')} added to regular cage {original_cage}.")
             logging.debug(f"TRANSFER: After modification - Regular: {len(self.mice_status.regular)}, Waiting: {len(self.mice_status.waiting)}, Death: {len(self.mice_status.death)}")
         self._cleanup_post_transfer()
@@ -200,22 +199,14 @@ class MouseTransfer(QDialog):
         self.selected_mouse = self.gui.selected_mouse # Ensure working with the currently selected mouse from GUI
         taCA = target_cage
 
-        current_cage = self.selected_mouse.get("nuCA")
-        if current_cage in self.mice_status.regular:
-            mice_list = self.mice_status.regular[current_cage]
-            if self.selected_mouse in mice_list: # Remove mice from original cage display
-                mice_list.remove(self.selected_mouse)
-                if not mice_list: # Remove the empty cages
-                    del self.mice_status.regular[current_cage]
+        self._remove_from_cage() # Remove mice from original cage display
 
         self._remove_from_dict("waiting")
 
         self.selected_mouse["nuCA"] = taCA
         self.selected_mouse["category"] = mut.assign_category(taCA) if mode == "existing" else self.current_category
 
-        if taCA not in self.mice_status.regular:
-            self.mice_status.regular[taCA] = []
-        self.mice_status.regular[taCA].append(self.selected_mouse)
+        self.mice_status.regular.setdefault(taCA, []).append(self.selected_mouse)
         self._cleanup_post_transfer(dialog)
 
     def validate_and_transfer(self, dialog):
@@ -265,24 +256,44 @@ class MouseTransfer(QDialog):
             QMessageBox.warning(dialog, "Cage Exists", f"Cage '{new_cage_no}' already exists. Please enter a different number.")
             self.new_cage_entry.clear()
             return
-        if self.current_category == "BACKUP" and (new_cage_no.startswith("8-A-") or new_cage_no.startswith("2-A-")):
+        if self.current_category == "BACKUP" and new_cage_no[:4] in mut.CAGE_PREFIX_CATEGORIES:
             QMessageBox.warning(dialog, "Format Error", f"Backup cages are not supposed to start with '8-A-' or '2-A-'. Please enter a different number.")
             self.new_cage_entry.clear()
             return
         
         self.confirm_transfer(dialog, new_cage_no, "new")
         
+    def _remove_from_cage(self):
+        """
+        Removes the selected mouse from its current regular cage, deleting the cage once it is empty.
+        The cage is looked up by the mouse's "nuCA", then the mouse is matched by identity,
+        avoiding a field-by-field dict comparison against every cage mate.
+        """
+        current_cage = self.selected_mouse.get("nuCA")
+        mice_list = self.mice_status.regular.get(current_cage)
+        if not mice_list:
+            return
+        for index, mouse in enumerate(mice_list):
+            if mouse is self.selected_mouse:
+                del mice_list[index]
+                logging.debug(f"TRANSFER: Removed mouse {self.selected_mouse.get('ID')} from regular cage {current_cage}.")
+                break
+        if not mice_list:
+            del self.mice_status.regular[current_cage]
+            logging.debug(f"TRANSFER: Deleted empty regular cage {current_cage}.")
+
     def _remove_from_dict(self, container_type: str):
         """
         Removes the selected mouse from a specified dictionary (e.g., 'waiting' or 'death').
         Args:
             container_type (str): The name of the dictionary to remove the mouse from (e.g., "waiting", "death").
+        Returns:
+            bool: True if the mouse was in that dictionary.
         """
         # Get the dict from string (e.g. "waiting" -> waiting)
         target_dict = getattr(self.mice_status, container_type)
-        # Remove mouse ID if it exists
-        if self.selected_mouse["ID"] in target_dict:
-            del target_dict[self.selected_mouse["ID"]]
+        # Remove mouse ID if it exists, a single hash lookup instead of a membership test and a del
+        return target_dict.pop(self.selected_mouse["ID"], None) is not None
 
     def _cleanup_post_transfer(self, dialog=None):
         """
@@ -296,5 +307,5 @@ class MouseTransfer(QDialog):
             dialog.close()
         logging.debug("TRANSFER: _cleanup_post_transfer called. Calling gui.redraw_canvas().")
         self.mouseDB[self.selected_mouse["ID"]] = self.selected_mouse # Update the main mouseDB
-        self.gui.redraw_canvas()
+        self.gui.redraw_canvas(recount=False, changed_mice=[self.selected_mouse]) # The source and target buckets in mice_status were already patched above
         self.gui.determine_save_status()
\ No newline at end of file
@@ -1,17 +1,53 @@
 import random
+from collections import Counter
+from functools import lru_cache
+import numpy as np
 import pandas as pd
 from datetime import date, datetime
 
 import traceback
 import logging
 
+# Shared generator for the column-wise ID helpers, each draws all the random digits it needs in one call
+RNG = np.random.default_rng()
+# Define the numeric code of each known genotype, the first digit of generated IDs
+GENOTYPE_ID_MAP = {
+    "hom-PP2A": "1",
+    "PP2A(w/-)": "2",
+    "PP2A(f/w)": "3",
+    "NEX-CRE-PP2A(f/w)": "4",
+    "CMV-CRE": "5",
+    "NEX-CRE": "6",
+    "CMV-CRE-PP2A(f/w)": "7"
+}
+# Define the sex ID digits, odd for males and even for females
+MALE_ID_DIGITS = ("1", "3", "5", "7", "9")
+FEMALE_ID_DIGITS = ("0", "2", "4", "6", "8")
+# Define the leading digits of rolled cage IDs, 2 and 8 are left to the IDs of 2-/8- prefixed cages
+ROLL_LEADING_DIGITS = (1, 3, 4, 5, 6, 7, 9)
+# Define the breeding category of each cage prefix, cages matching none of them are BACKUP
+CAGE_PREFIX_CATEGORIES = {"8-A-": "CMV + PP2A", "2-A-": "NEX + PP2A"}
+# Define cages that are their own category
+SPECIAL_CAGES = ["Memorial", "Death Row", "Waiting Room"]
+# Define every category a mouse can be assigned to, the breeding categories first
+CATEGORIES = ["BACKUP", "NEX + PP2A", "CMV + PP2A", "Memorial", "Death Row", "Waiting Room"]
+# Define the monitor marker of each genotype component, tuples carry their own text color
+GENOTYPE_MARKERS = {
+    "CMV-CRE": "C",
+    "NEX-CRE": "N",
+    "wt": "wt",
+    "hom-PP2A": ("P", "gold"),
+    "PP2A(f/w)": ("P", "olivedrab"),
+    "PP2A(w/-)": ("P", "chocolate"),
+    "PP2A": "P", # PP2A fallback
+}
+
 def preprocess_df(df_data):
-    df = df_data.copy()
-    df = df.dropna(how="all")
+    df = df_data.dropna(how="all") # Returns a new frame, so the sheet passed in is never mutated and needs no extra copy
     df = add_optional_cols(df)
-    df["category"] = df["cage"].apply(assign_category)
+    df["category"] = assign_categories(df["cage"])
+    df = df_date_to_days(df) # Converts birthDate once, before the IDs are built from it
     df = issue_id_df(df)
-    df = df_date_to_days(df)
     df = df.set_index('ID',drop=False, append=False, inplace=False, verify_integrity=False)
     return df
 
@@ -25,20 +61,25 @@ def assign_category(cage:str) -> str:
     """
     cage_str = str(cage).strip()
 
-    if cage_str in {"Memorial", "Death Row", "Waiting Room"}:
+    if cage_str in SPECIAL_CAGES:
         return cage_str
-    if cage_str.startswith("8-A-"):
-        return "CMV + PP2A"
-    if cage_str.startswith("2-A-"):
-        return "NEX + PP2A"
-    return "BACKUP"
+    return CAGE_PREFIX_CATEGORIES.get(cage_str[:4], "BACKUP") # Both breeding prefixes are four characters long
+
+def assign_categories(cage_series):
+    """Column-wise assign_category, classifying every cage in a single pass"""
+    cage_str = cage_series.astype(str).str.strip()
+    categories = cage_str.str[:4].map(CAGE_PREFIX_CATEGORIES) # One slice and one dict lookup covers both breeding prefixes
+    special_mask = cage_str.isin(SPECIAL_CAGES)
+    categories[special_mask] = cage_str[special_mask]
+    # Interned as int8 codes, so the category masks during preprocessing compare integers instead of strings
+    return pd.Series(pd.Categorical(categories.fillna("BACKUP"), categories=CATEGORIES), index=cage_series.index)
 
 def add_optional_cols(df):
     optional_columns = ["age","breedDays","parentF","parentM","category"]
-    for col in optional_columns:
-        if col not in df:
-            df[col] = None
-    df["nuCA"] = df.loc[:, "cage"] # Add nuCA for temporary cage storage solution, nuCA == new cage | nuka-ColA
+    missing_columns = pd.Index(optional_columns).difference(df.columns, sort=False).tolist() # One set difference instead of a probe per column
+    if missing_columns:
+        df[missing_columns] = None
+    df["nuCA"] = df["cage"] # Add nuCA for temporary cage storage solution, nuCA == new cage | nuka-ColA
     return df
 
 def cleanup_optional_cols(df):
@@ -56,55 +97,40 @@ def issue_id_df(df):
     if not id_mask.any():
         return df
 
-    # Generate component IDs
-    components = {
-        "genoID": ("genotype", process_genotypeID),
-        "dobID": ("birthDate", process_birthDateID),
-        "toeID": ("toe", process_toeID),
-        "sexID": ("sex", process_sexID),
-        "cageID": ("nuCA", process_cageID)
-    }
-    
-    for col, (src_col, processor) in components.items():
-        df.loc[id_mask, col] = df.loc[id_mask, src_col].apply(processor)
-
-    # Compose full IDs
-    df.loc[id_mask, "ID"] = df.loc[id_mask].apply(
-        lambda row: f"{row['genoID']}{row['dobID']}{row['toeID']}{row['sexID']}{row['cageID']}",
-        axis=1
-    )
+    # Generate component IDs, in the order they appear in the full ID (genoID, dobID, toeID, sexID, cageID)
+    components = [
+        ("genotype", genotype_ids),
+        ("birthDate", birth_date_ids),
+        ("toe", toe_ids),
+        ("sex", sex_ids),
+        ("nuCA", cage_ids)
+    ]
+
+    # Compose full IDs column-wise instead of formatting row by row, slicing the rows needing IDs only once
+    df_missing = df.loc[id_mask, [src_col for src_col, _ in components]]
+    new_ids = pd.Series("", index=df_missing.index, dtype=object)
+    for src_col, processor in components:
+        new_ids = new_ids + processor(df_missing[src_col])
+    df.loc[id_mask, "ID"] = new_ids
 
     # Handle duplicates and conflicts
-    new_ids = df.loc[id_mask, "ID"]
     existing_ids = df.loc[~id_mask, "ID"]
     
-    # Combined check for duplicates within new IDs and conflicts with existing
-    needs_regeneration = new_ids.duplicated(keep=False) | new_ids.isin(existing_ids)
+    # Combined check for duplicates within new IDs and conflicts with existing, as set arithmetic on the few new IDs
+    new_id_counts = Counter(new_ids)
+    conflicting_ids = (new_id_counts.keys() & set(existing_ids)) | {new_id for new_id, count in new_id_counts.items() if count > 1}
     
-    if needs_regeneration.any():
+    if conflicting_ids:
+        needs_regeneration = new_ids.isin(conflicting_ids)
         # Regenerate full random IDs for problematic cases
-        df.loc[needs_regeneration[needs_regeneration].index, "ID"] = \
-            df.loc[needs_regeneration[needs_regeneration].index].apply(
-                lambda _: generate_random_id(), axis=1
-            )
-        
-    # Cleanup temporary columns
-    df.drop(list(components.keys()), axis=1, inplace=True, errors="ignore")
-    
+        df.loc[needs_regeneration[needs_regeneration].index, "ID"] = generate_random_ids(needs_regeneration.sum())
+
     return df
 
 def process_genotypeID(genotype: str) -> str:
     """Convert genotype to numeric code"""
-    genotype_map = {
-        "hom-PP2A": "1",
-        "PP2A(w/-)": "2",
-        "PP2A(f/w)": "3",
-        "NEX-CRE-PP2A(f/w)": "4",
-        "CMV-CRE": "5",
-        "NEX-CRE": "6",
-        "CMV-CRE-PP2A(f/w)": "7"
-    }
-    return genotype_map.get(str(genotype), str(random.randint(8,9)))
+    genotype_code = GENOTYPE_ID_MAP.get(str(genotype))
+    return genotype_code if genotype_code is not None else str(random.randint(8,9)) # Only roll for unknown genotypes
 
 def process_birthDateID(bdate: datetime) -> str:
     """Convert birthdate to YYMMDD format"""
@@ -133,7 +159,7 @@ def process_toeID(toe: str) -> str:
 
 def process_sexID(sex: str) -> str:
     """Generate sex ID (odd for male, even for female)"""
-    return str(random.choice([1, 3, 5, 7, 9])) if sex == "♂" else str(random.choice([0, 2, 4, 6, 8]))
+    return random.choice(MALE_ID_DIGITS) if sex == "♂" else random.choice(FEMALE_ID_DIGITS)
 
 def process_cageID(cage: str) -> str:
     """Process cage number with consistent formatting.
@@ -163,12 +189,53 @@ def process_cageID(cage: str) -> str:
         
     return str(roll_with_rickroll())
 
+def genotype_ids(genotype_series):
+    """Column-wise process_genotypeID"""
+    genotype_codes = genotype_series.astype(str).map(GENOTYPE_ID_MAP).astype(object)
+    unknown_mask = genotype_codes.isna()
+    genotype_codes[unknown_mask] = RNG.integers(8, 10, unknown_mask.sum()).astype(str) # Only roll for unknown genotypes
+    return genotype_codes
+
+def birth_date_ids(bdate_series):
+    """Column-wise process_birthDateID, for a birthDate column already converted by df_date_to_days"""
+    bdates = pd.to_datetime(bdate_series, errors="coerce")
+    return bdates.dt.strftime("%y%m%d").fillna("000000")
+
+def toe_ids(toe_series):
+    """Column-wise process_toeID"""
+    toe_num = toe_series.astype(str).str.removeprefix("toe")
+    return toe_num.str.zfill(2).where(toe_num.str.fullmatch(r"\d{1,2}"), "69")
+
+def sex_ids(sex_series):
+    """Column-wise process_sexID"""
+    male_ids = RNG.choice(MALE_ID_DIGITS, len(sex_series))
+    female_ids = RNG.choice(FEMALE_ID_DIGITS, len(sex_series))
+    return pd.Series(np.where(sex_series == "♂", male_ids, female_ids), index=sex_series.index)
+
+def cage_ids(cage_series):
+    """Column-wise process_cageID"""
+    cage_str = cage_series.astype(str).str.strip()
+    cage_digits = cage_str.str.replace("-", "", regex=False)
+    # Same precedence as process_cageID: an -A- cage with a 2/8 prefix first, then a -B- cage with a 2/8 prefix
+    a_mask = (cage_str.str.contains("-A-", regex=False) & cage_digits.str.match(r"[28]A")).to_numpy()
+    b_mask = (~a_mask & cage_str.str.contains("-B-", regex=False) & cage_digits.str.match(r"[28]B")).to_numpy()
+    suffix = cage_digits.str.extract(r"^[28]A([^A]*)")[0].where(a_mask, cage_digits.str.extract(r"^[28]B([^B]*)")[0])
+
+    cage_codes = roll_with_rickrolls(len(cage_series))
+    ab_mask = a_mask | b_mask
+    if ab_mask.any():
+        middle_digits = np.where(a_mask, RNG.integers(1, 6, len(cage_series)), RNG.integers(6, 10, len(cage_series)))
+        cage_codes[ab_mask] = (cage_digits.str[0] + pd.Series(middle_digits.astype(str), index=cage_series.index)
+                               + purge_leading_zeros_col(suffix.fillna(""), 4))[ab_mask].to_numpy()
+    return pd.Series(cage_codes, index=cage_series.index, dtype=object)
+
 ##########################################################################################################################
 
 def process_df_before_export(df, date_cols):
     df = df_date_col_formatter(df, date_cols) # Format the dates into strings so they won"t get ruined by Excel
     df = cleanup_optional_cols(df)
-    df = df.fillna("-")
+    for col in df.columns[df.isna().any()]: # Filled per column, a frame-wide fillna warns about downcasting object columns
+        df[col] = df[col].astype(object).where(df[col].notna(), "-")
     df.reset_index(level=None, drop=True, inplace=False)
     return df
 
@@ -178,22 +245,40 @@ def df_date_col_formatter(df, date_col):
     """Format date columns consistently to 'yy-mm-dd' strings"""
     for col in date_col:
         if col in df.columns:
-            df[col] = df[col].apply(lambda x: convert_date_to_string(x) if pd.notna(x) else "-")
+            df[col] = dates_to_strings(df[col])
     return df
 
+def dates_to_strings(date_series):
+    """Column-wise convert_date_to_string, "-" for missing dates"""
+    dates = pd.to_datetime(convert_to_dates(date_series), errors="coerce") # Normalize each distinct value once, then format in one pass
+    date_strings = dates.dt.strftime("%y-%m-%d").where(dates.notna(), "")
+    return date_strings.where(date_series.notna(), "-").astype(object)
+
 def df_date_to_days(df_data):
     """Convert date columns to days calculations"""
-    df_data["birthDate"] = df_data["birthDate"].apply(convert_to_date)
-    df_data["age"] = df_data["birthDate"].apply(lambda dob: date_to_days(dob))
+    df_data["birthDate"] = convert_to_dates(df_data["birthDate"])
+    df_data["age"] = dates_to_days(df_data["birthDate"])
     # Calculate last breed days for alive and non-BACKUP mice
     breeding_mask = ~df_data["category"].isin(["Memorial", "BACKUP"])
-    df_data["breedDays"] = None 
+    df_data["breedDays"] = None
     if breeding_mask.any():
-        df_data.loc[breeding_mask, "breedDate"] = df_data.loc[breeding_mask, "breedDate"].apply(convert_to_date)
-        df_data.loc[breeding_mask, "breedDays"] = df_data.loc[breeding_mask, "breedDate"].apply(
-            lambda bd: date_to_days(bd))
+        df_data.loc[breeding_mask, "breedDate"] = convert_to_dates(df_data.loc[breeding_mask, "breedDate"])
+        df_data.loc[breeding_mask, "breedDays"] = dates_to_days(df_data.loc[breeding_mask, "breedDate"])
     return df_data
 
+def dates_to_days(date_series):
+    """Column-wise date_to_days, integer days as Python ints and None for missing or future dates"""
+    epoch_days = pd.to_datetime(date_series, errors="coerce").to_numpy(dtype="datetime64[D]")
+    valid_mask = ~np.isnat(epoch_days)
+    days = np.zeros(len(epoch_days), dtype=np.int64)
+    days[valid_mask] = (np.datetime64(date.today(), "D") - epoch_days[valid_mask]).astype(np.int64)
+    future_mask = valid_mask & (days < 0)
+    for future_date in epoch_days[future_mask]:
+        logging.error(f"Cannot calculate age from future date: {future_date}.")
+    days = days.astype(object) # Boxes each day count as a Python int, like date_to_days
+    days[~valid_mask | future_mask] = None
+    return pd.Series(days, index=date_series.index, dtype=object)
+
 def date_to_days(date_obj):
     """Calculates age in days from birthDate"""
     today_date = date.today()
@@ -207,6 +292,8 @@ def date_to_days(date_obj):
         
 def convert_date_to_string(date_obj):
     """Convert date to 'yy-mm-dd' string format"""
+    if date_obj is pd.NaT: # Passes as a datetime but cannot be formatted
+        return ""
     if isinstance(date_obj, (datetime, pd.Timestamp)):  # Proper datetime objects
         return date_obj.strftime("%y-%m-%d")
     if isinstance(date_obj, date):
@@ -221,25 +308,38 @@ def convert_date_to_string(date_obj):
     
 def convert_to_date(date_val):
     """Convert input to date object, returns None for invalid dates"""
-    if pd.isna(date_val):
-        return None
-    try: # Convert to date object
-        if isinstance(date_val, (pd.Timestamp, datetime)):
+    try: # Convert to date object, type checks first as they are far cheaper than a scalar pd.isna
+        if date_val is pd.NaT: # NaT passes as a datetime
+            return None
+        if isinstance(date_val, datetime): # Covers pd.Timestamp
             return date_val.date()
         if isinstance(date_val, date):
             return date_val
-        # Try multiple common formats to parse if string
         if isinstance(date_val, str):
-            for fmt in ("%y-%m-%d", "%Y-%m-%d", "%d-%b-%y", "%d-%b-%Y", "%m/%d/%Y", "%Y/%m/%d", "%y/%m/%d"):
-                try:
-                    return datetime.strptime(date_val, fmt).date()
-                except ValueError:
-                    continue
+            return parse_date_str(date_val)
         return None
     except Exception as e:
         logging.error(f"Unexpected error processing {date_val}: {str(e)}")
         return None
 
+def convert_to_dates(date_series):
+    """Column-wise convert_to_date, converting each distinct value only once"""
+    if pd.api.types.is_datetime64_any_dtype(date_series): # Already parsed by the reader, no per-value dispatch needed
+        return date_series.dt.date.astype(object).where(date_series.notna(), None)
+    codes, uniques = pd.factorize(date_series) # Missing values get code -1, which picks the trailing None
+    converted = np.array([convert_to_date(date_val) for date_val in uniques] + [None], dtype=object)
+    return pd.Series(converted[codes], index=date_series.index, dtype=object)
+
+@lru_cache(maxsize=None) # Littermates share birth dates, so each distinct string is only parsed once
+def parse_date_str(date_str:str):
+    """Try multiple common formats to parse a date string, returns None if none match"""
+    for fmt in ("%y-%m-%d", "%Y-%m-%d", "%d-%b-%y", "%d-%b-%Y", "%m/%d/%Y", "%Y/%m/%d", "%y/%m/%d"):
+        try:
+            return datetime.strptime(date_str, fmt).date()
+        except ValueError:
+            continue
+    return None
+
 ##########################################################################################################################
 
 def mice_dot_color_picker(sex, age):
@@ -249,22 +349,19 @@ def mice_dot_color_picker(sex, age):
         color = "lightblue" if sex == "♂" else "lightpink"
     return color
 
+def mice_dot_colors(sexes, ages):
+    """Column-wise mice_dot_color_picker, resolving the dot colors of many mice in one pass"""
+    sexes = np.asarray(sexes, dtype=object)
+    ages = pd.to_numeric(pd.Series(ages, dtype=object), errors="coerce").to_numpy(dtype=float)
+    return np.where(ages > 300, "grey", np.where(sexes == "♂", "lightblue", "lightpink"))
+
+@lru_cache(maxsize=256) # A colony only carries a handful of genotypes, so every redraw after the first is a lookup
 def genotype_abbreviation_color_picker(genotype_string):
     geno_text = ""
     geno_color = "black"
     valid_identifier = False
 
-    target_components = {
-        "CMV-CRE": "C",
-        "NEX-CRE": "N",
-        "wt": "wt",
-        "hom-PP2A": ("P", "gold"),
-        "PP2A(f/w)": ("P", "olivedrab"),
-        "PP2A(w/-)": ("P", "chocolate"),
-        "PP2A": "P", # PP2A fallback
-        }
-
-    for component, marker in target_components.items():
+    for component, marker in GENOTYPE_MARKERS.items():
         if component in genotype_string:
             valid_identifier = True
             if component == "wt":  # wt overrides other markers
@@ -291,33 +388,39 @@ def genotype_abbreviation_color_picker(genotype_string):
 
     return geno_text, geno_color
 
+def genotype_abbreviations(genotypes):
+    """Column-wise genotype_abbreviation_color_picker, resolving each distinct genotype only once"""
+    picks = {genotype: genotype_abbreviation_color_picker(genotype) for genotype in dict.fromkeys(genotypes)}
+    return [picks[genotype] for genotype in genotypes]
+
 ##########################################################################################################################
 
-def generate_random_id():
-        return "".join([str(random.randint(0, 9)) for _ in range(16)])
-
-def roll_with_rickroll():
-    while True:
-        num = random.randint(100000, 999999)
-        # Check if number is in forbidden ranges
-        if (200000 <= num <= 299999) or (800000 <= num <= 899999):
-            continue  # Re-roll
-        else:
-            return f"{num:06d}"  # Valid number
-        
+def generate_random_ids(n:int):
+    """n random 16-digit IDs, all digits drawn in one call"""
+    digits = RNG.integers(0, 10, (n, 16)).astype(np.uint32) + ord("0")
+    return digits.view("U16").ravel().astype(object)
+
+def roll_with_rickroll() -> str:
+    """Random 6-digit number outside the forbidden 2xxxxx and 8xxxxx ranges, drawn without re-rolls"""
+    return f"{random.choice(ROLL_LEADING_DIGITS)}{random.randint(0, 99999):05d}"
+
+def roll_with_rickrolls(n:int):
+    """Column-wise roll_with_rickroll, every valid leading digit covers equally many numbers so it is drawn first"""
+    leading_digits = RNG.choice(ROLL_LEADING_DIGITS, n)
+    return (leading_digits * 100000 + RNG.integers(0, 100000, n)).astype(str).astype(object)
+
+def purge_leading_zeros_col(s_series, digits:int):
+    """Column-wise purge_leading_zeros"""
+    padded = s_series.str.zfill(digits).str[-digits:].to_numpy(dtype=f"U{digits}")
+    char_codes = padded.view(np.uint32).reshape(-1, digits)
+    leading_zeros = np.cumprod(char_codes == ord("0"), axis=1).astype(bool)
+    random_digits = RNG.integers(1, 10, char_codes.shape) + ord("0")
+    purged = np.where(leading_zeros, random_digits, char_codes).astype(np.uint32)
+    return pd.Series(purged.view(f"U{digits}").ravel(), index=s_series.index, dtype=object)
+
 def purge_leading_zeros(s:str, digits:int):
-    # Truncate if longer than required
-    if len(s) > digits:
-        s = s[-digits:] 
-    else:
-        # Pad with zeros if shorter
-        s = s.zfill(digits)
-    result = []
-    zero_run = True  # Track if we"re still in leading zeros
-    for c in s:
-        if c == "0" and zero_run:
-            result.append(str(random.randint(1, 9)))
-        else:
-            result.append(c)
-            zero_run = False
-    return "".join(result)[:digits].ljust(digits, "0")
\ No newline at end of file
+    # Truncate if longer than required, pad with zeros if shorter
+    s = s[-digits:] if len(s) > digits else s.zfill(digits)
+    significant = s.lstrip("0")
+    # Replace the whole leading zero run with random nonzero digits in one draw
+    return "".join(random.choices("123456789", k=len(s) - len(significant))) + significant
\ No newline at end of file
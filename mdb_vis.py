@@ -13,7 +13,7 @@ import logging
 
 class MouseGraphicsItem(QGraphicsWidget):
     """A custom QGraphicsWidget to represent a single mouse, including its dot and genotype text."""
-    def __init__(self, mouse_data, size=30, parent=None):
+    def __init__(self, mouse_data, size=30, parent=None, dot_color=None, geno_marker=None):
         super().__init__(parent)
         self.setMinimumSize(size, size)
         self.setPreferredSize(size, size)
@@ -23,14 +23,20 @@ class MouseGraphicsItem(QGraphicsWidget):
         self.setFlag(QGraphicsWidget.ItemIsMovable, False)
         self.setData(0, mouse_data) # Store mouse data in the item
         self.setAcceptHoverEvents(True) # Enable hover events
+        self.setCacheMode(QGraphicsWidget.DeviceCoordinateCache) # Repaints blit a cached pixmap instead of redrawing dot and text
 
         self.sex = self.mouse_data.get("sex", "N/A")
         self.age = self.mouse_data.get("age", None)
         self.genotype = self.mouse_data.get("genotype", "N/A")
 
-        self.dot_color = QColor(mut.mice_dot_color_picker(self.sex, self.age))
-        self.geno_text, geno_color_str = mut.genotype_abbreviation_color_picker(self.genotype)
+        if dot_color is None: # Colors are normally resolved per cage in one pass, see CageGraphicsItem
+            dot_color = mut.mice_dot_color_picker(self.sex, self.age)
+        self.dot_color = QColor(dot_color)
+        if geno_marker is None:
+            geno_marker = mut.genotype_abbreviation_color_picker(self.genotype)
+        self.geno_text, geno_color_str = geno_marker
         self.geno_color = QColor(geno_color_str)
+        self.geno_font = QFont("Arial", 14) # Built once here, paint() runs again for every exposed region
 
     def paint(self, painter, option, widget):
         # Draw the ellipse
@@ -39,7 +45,7 @@ class MouseGraphicsItem(QGraphicsWidget):
         painter.drawEllipse(self.rect())
 
         # Draw the genotype text
-        painter.setFont(QFont("Arial", 14))
+        painter.setFont(self.geno_font)
         painter.setPen(QPen(self.geno_color))
         text_rect = painter.fontMetrics().boundingRect(self.geno_text)
         painter.drawText(
@@ -55,7 +61,14 @@ class CageGraphicsItem(QGraphicsWidget):
         self.cage_no = cage_no
         self.mice_data = mice_data
         self.cage_color = None
+        self.label_text = f"Cage: {cage_no}"
+        self.label_font = QFont("Arial", 10)
         self.setFlag(QGraphicsWidget.ItemIsMovable, False) # Cages should not be movable
+        self.setCacheMode(QGraphicsWidget.DeviceCoordinateCache) # Frame and label are static until the next rebuild
+
+        # Coerce the breeding days of the whole cage once here rather than per mouse on every repaint
+        breed_days = pd.to_numeric(pd.Series([mouse.get("breedDays") for mouse in mice_data], dtype=object), errors="coerce")
+        self.breeding_overdue = bool((breed_days > 90).any())
 
         # Default size for regular cages
         self.min_width = 180
@@ -88,24 +101,21 @@ class CageGraphicsItem(QGraphicsWidget):
     def paint(self, painter, option, widget):
         # Draw the cage rectangle
         cage_color = self.cage_color if self.cage_color is not None else QColor(Qt.black)
-        for mouse in self.mice_data:
-            breed_days = pd.to_numeric(mouse.get("breedDays"), errors="coerce")
-            if pd.notna(breed_days) and breed_days > 90:
-                cage_color = QColor(Qt.red)
-                break
+        if self.breeding_overdue:
+            cage_color = QColor(Qt.red)
         
         painter.setPen(QPen(cage_color, 2))
         painter.setBrush(Qt.NoBrush)
         painter.drawRect(self.rect())
 
         # Draw cage number text
-        painter.setFont(QFont("Arial", 10))
+        painter.setFont(self.label_font)
         painter.setPen(QPen(Qt.black))
-        text_rect = painter.fontMetrics().boundingRect(f"Cage: {self.cage_no}")
+        text_rect = painter.fontMetrics().boundingRect(self.label_text)
         painter.drawText(
             self.rect().center().x() - text_rect.width() / 2,
             self.rect().top() + 15, # Position above the rectangle
-            f"Cage: {self.cage_no}"
+            self.label_text
         )
 
     def _plot_mice_in_cage(self):
@@ -115,17 +125,15 @@ class CageGraphicsItem(QGraphicsWidget):
 
         # Calculate rows and columns for a more even distribution
         # Aim for a layout that is as square as possible
-        if num_mice > 0:
-            cols = int(np.ceil(np.sqrt(num_mice)))
-            rows = int(np.ceil(num_mice / cols))
-        else:
-            cols = 1
-            rows = 1
+        cols = int(np.ceil(np.sqrt(num_mice)))
+        grid_rows, grid_cols = np.divmod(np.arange(num_mice), cols)
 
-        for i, mouse in enumerate(self.mice_data):
-            row = i // cols
-            col = i % cols
-            mouse_item = MouseGraphicsItem(mouse, size=30)
+        dot_colors = mut.mice_dot_colors([mouse.get("sex") for mouse in self.mice_data],
+                                         [mouse.get("age") for mouse in self.mice_data])
+        geno_markers = mut.genotype_abbreviations([mouse.get("genotype", "N/A") for mouse in self.mice_data])
+
+        for mouse, row, col, dot_color, geno_marker in zip(self.mice_data, grid_rows.tolist(), grid_cols.tolist(), dot_colors, geno_markers):
+            mouse_item = MouseGraphicsItem(mouse, size=30, dot_color=dot_color, geno_marker=geno_marker)
             self.cage_layout.addItem(mouse_item, row, col)
             self.cage_layout.setAlignment(mouse_item, Qt.AlignCenter) # Center items within their cells
 
@@ -149,6 +157,9 @@ class MouseVisualizer(QWidget):
         self.selected_mouse = None
 
         self.leaving_timer = None
+        self.hover_timer = None
+        self.hover_position = None
+        self.hover_view = None
         self.current_metadata_window = None
         self.edited_mouse_artist = None
         self.last_hovered_mouse = None
@@ -177,12 +188,40 @@ class MouseVisualizer(QWidget):
         # Set scene rectangle to define the drawing area (similar to xlim/ylim)
         self.graphics_scene.setSceneRect(0, 0, 1000, 800) # Adjust scene size as needed
 
-        self.mice_count_for_monitor()
+        if not self.draw_cage_monitor():
+            return None # Return None if no data to plot
+
+        # Connect mouse events for interaction
+        self.graphics_view.setMouseTracking(True) # Enable mouse tracking for hover events
+        self.graphics_view.viewport().installEventFilter(self) # Install event filter to capture mouse events
+
+        self.canvas_widget = self.graphics_view # Store the QGraphicsView object
+        return self.canvas_widget
+
+    def refresh_cage_monitor(self, recount=True):
+        """
+        Rebuilds the cage items inside the existing scene after mice were moved or edited.
+        The view, its event filter and this visualizer are kept, Qt then only repaints the regions that changed.
+        Pass recount=False when the caller already patched mice_status itself, as transfers do.
+        Returns False when there is nothing left to plot.
+        """
+        logging.debug(f"VIS: refresh_cage_monitor called. current_category: {self.current_category}")
+        if self.hover_timer:
+            self.hover_timer.stop()
+        self.close_metadata_window()
+        self.selected_mouse = None
+        self.graphics_scene.clear()
+        return self.draw_cage_monitor(recount)
+
+    def draw_cage_monitor(self, recount=True):
+        """Counts the mice and lays out every cage in the scene, returns False when there is nothing to plot."""
+        if recount: # Re-bucketing walks the whole category, skipped when mice_status is already up to date
+            self.mice_count_for_monitor()
         logging.debug(f"DEBUG: Mice displayed - Regular: {len(self.mice_status.regular)}, Waiting: {len(self.mice_status.waiting)}, Death: {len(self.mice_status.death)}")
 
         if not self.mice_status.regular and not self.mice_status.waiting and not self.mice_status.death:
             logging.debug("DEBUG: No mice data to plot for cage monitor.")
-            return None # Return None if no data to plot
+            return False
 
         self.mouse_artists.clear() # Clear previous mouse artists
 
@@ -199,13 +238,7 @@ class MouseVisualizer(QWidget):
         grid_widget.setPos(50, 20) # Move regular cages higher with a top margin
 
         self.draw_special_cages_qt()
-
-        # Connect mouse events for interaction
-        self.graphics_view.setMouseTracking(True) # Enable mouse tracking for hover events
-        self.graphics_view.viewport().installEventFilter(self) # Install event filter to capture mouse events
-
-        self.canvas_widget = self.graphics_view # Store the QGraphicsView object
-        return self.canvas_widget
+        return True
     
     def eventFilter(self, watched, event):
         if watched == self.graphics_view.viewport():
@@ -219,9 +252,8 @@ class MouseVisualizer(QWidget):
 
     def draw_cages_qt(self, cage_data, layout):
         cols = 3 # Number of columns for the grid layout
-        for cage_index, (cage_no, mice) in enumerate(cage_data.items()):
-            row = cage_index // cols
-            col = cage_index % cols
+        grid_rows, grid_cols = np.divmod(np.arange(len(cage_data)), cols)
+        for (cage_no, mice), row, col in zip(cage_data.items(), grid_rows.tolist(), grid_cols.tolist()):
             cage_item = CageGraphicsItem(cage_no, mice)
             layout.addItem(cage_item, row, col)
             self.mouse_artists.extend([(mouse_item, mouse_item.mouse_data) for mouse_item in cage_item.findChildren(MouseGraphicsItem)])
@@ -266,26 +298,41 @@ class MouseVisualizer(QWidget):
             logging.debug("DEBUG: mouseDB is empty in mice_count_for_monitor.")
             return
 
-        for mouse_info in self.mouseDB.values():
-            cage_key = mouse_info.get("nuCA")
-            ID = mouse_info.get("ID")
-            category = mouse_info.get("category")
-
-            if category == self.current_category and cage_key not in ["Waiting Room", "Death Row"]:
-                if cage_key not in self.mice_status.regular:
-                    self.mice_status.regular[cage_key] = []
-                self.mice_status.regular[cage_key].append(mouse_info)
-            elif cage_key == "Waiting Room":
-                self.mice_status.waiting[ID] = mouse_info
-            elif cage_key == "Death Row":
-                self.mice_status.death[ID] = mouse_info
+        mice = pd.Series(self.gui.get_category_mice(self.current_category)
+                         + self.gui.get_category_mice("Waiting Room") + self.gui.get_category_mice("Death Row"), dtype=object)
+        if mice.empty:
+            return
+        df_mice = pd.DataFrame.from_records(mice.tolist(), columns=["ID", "nuCA", "category"])
+        waiting_mask = df_mice["nuCA"] == "Waiting Room"
+        death_mask = df_mice["nuCA"] == "Death Row"
+        regular_mask = (df_mice["category"] == self.current_category) & ~waiting_mask & ~death_mask
+
+        # Bucket the mouse dicts themselves, transfers edit them in place through these containers
+        for cage_key, cage_mice in mice[regular_mask].groupby(df_mice.loc[regular_mask, "nuCA"], sort=False, dropna=False):
+            self.mice_status.regular[cage_key if pd.notna(cage_key) else None] = cage_mice.tolist()
+        self.mice_status.waiting.update(zip(df_mice.loc[waiting_mask, "ID"], mice[waiting_mask]))
+        self.mice_status.death.update(zip(df_mice.loc[death_mask, "ID"], mice[death_mask]))
         logging.debug(f"VIS: mice_count_for_monitor completed. Regular: {len(self.mice_status.regular)}, Waiting: {len(self.mice_status.waiting)}, Death: {len(self.mice_status.death)}")
 
     #########################################################################################################################
 
-    def on_hover(self, event, graphics_view): # Map event position to scene coordinates
-        scene_position = graphics_view.mapToScene(event.position().toPoint())
-        item = graphics_view.scene().itemAt(scene_position, graphics_view.transform())
+    def on_hover(self, event, graphics_view): # Only hit-test once the pointer rests, not on every move event
+        if self.menu or event.buttons() != Qt.NoButton: # Nothing to show while the context menu is up or a button is held
+            return
+        self.hover_position = event.position().toPoint()
+        self.hover_view = graphics_view
+        if not self.hover_timer:
+            self.hover_timer = QTimer(self) # Parent the timer to self
+            self.hover_timer.setSingleShot(True)
+            self.hover_timer.timeout.connect(lambda: self.hover_hit_test(self.hover_position, self.hover_view))
+        self.hover_timer.start(50) # Restarting pushes the hit test back while the pointer keeps moving
+
+    def hover_hit_test(self, view_position, graphics_view): # Map view position to scene coordinates
+        try:
+            scene_position = graphics_view.mapToScene(view_position)
+            item = graphics_view.scene().itemAt(scene_position, graphics_view.transform())
+        except RuntimeError: # The view was replaced by a redraw while the timer was pending
+            return
 
         if item and isinstance(item, QGraphicsWidget):
             mouse = item.data(0) # Retrieve stored mouse data
@@ -294,13 +341,13 @@ class MouseVisualizer(QWidget):
                     self.leaving_timer.stop()
                     self.leaving_timer = None
 
-                if self.last_hovered_mouse and self.last_hovered_mouse == mouse:
+                if self.last_hovered_mouse is mouse: # Same dict, skip the field-by-field comparison
                     return
 
                 if self.current_metadata_window:
                     self.current_metadata_window.close()
 
-                self.show_metadata_window(mouse, graphics_view.mapToGlobal(event.position().toPoint()))
+                self.show_metadata_window(mouse, graphics_view.mapToGlobal(view_position))
                 self.selected_mouse = mouse # Set selected mouse on hover
                 self.last_hovered_mouse = mouse
                 return
@@ -341,6 +388,7 @@ class MouseVisualizer(QWidget):
                 self.menu.addAction("Edit mouse entry", self.gui.transfer_mouse_action)
 
         self.menu.exec(global_pos)
+        self.menu = None # Closed again, hover popups may show from here on
 
     def show_metadata_window(self, mouse, global_pos):
         if self.menu:  # Don not open if context menu is open
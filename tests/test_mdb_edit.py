@@ -0,0 +1,65 @@
+import copy
+import os
+from datetime import date
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pandas as pd
+import pytest
+from PySide6.QtWidgets import QApplication, QMessageBox, QWidget
+
+import mdb_edit as medit
+import mdb_io as mio
+
+
+class StubGUI(QWidget):
+    """Stands in for the main window, recording the calls the editor makes on it."""
+    def __init__(self):
+        super().__init__()
+        self.redraws = []
+        self.save_status_checks = 0
+
+    def redraw_canvas(self, **kwargs):
+        self.redraws.append(kwargs)
+
+    def determine_save_status(self):
+        self.save_status_checks += 1
+
+@pytest.fixture
+def gui(monkeypatch):
+    QApplication.instance() or QApplication([])
+    monkeypatch.setattr(QMessageBox, "information", lambda *args, **kwargs: QMessageBox.Ok)
+    monkeypatch.setattr(QMessageBox, "critical", lambda *args, **kwargs: QMessageBox.Ok)
+    return StubGUI()
+
+def reader_mouse(mouse_id, category, breed_date):
+    """A mouse as data_preprocess leaves it when the sheet's breedDate column was read as datetime64."""
+    return {"ID": mouse_id, "cage": "8-A-1" if category != "BACKUP" else "1-B-1", "nuCA": "8-A-1" if category != "BACKUP" else "1-B-1",
+            "sex": "♀", "toe": "toe3", "genotype": "WT", "birthDate": date(2024, 1, 2), "age": 653,
+            "breedDate": breed_date, "breedDays": None, "category": category, "parentF": "-", "parentM": "-"}
+
+def save_edit(gui, mouse_db, mouse_id, genotype):
+    """Opens the editor on a mouse, types a genotype and saves, as a user would."""
+    editor = medit.MouseEditor(gui, mouse_db, mouse_db[mouse_id], mode="edit")
+    editor.show()
+    editor.edit_genotype_entry.setText("typo")
+    editor.edit_genotype_entry.setText(genotype)
+    editor.save_edit_entry()
+    editor.hide()
+
+@pytest.mark.parametrize("category, breed_date", [("CMV + PP2A", pd.Timestamp("2025-06-01")), ("BACKUP", pd.NaT)])
+def test_untouched_edit_keeps_reader_dates(gui, category, breed_date):
+    mouse_db = {"7260730690432770": reader_mouse("7260730690432770", category, breed_date)}
+    processed_data = copy.deepcopy(mouse_db)
+
+    save_edit(gui, mouse_db, "7260730690432770", "WT") # Typed and reverted
+    assert gui.redraws == [] and gui.save_status_checks == 0
+    assert mouse_db["7260730690432770"]["breedDate"] is breed_date # Not rewritten as a date
+    assert not mio.find_changes_for_changelog(processed_data, mouse_db, check_only=True)
+
+def test_edit_with_reader_dates_saves_changes(gui):
+    mouse_db = {"7260730690432770": reader_mouse("7260730690432770", "CMV + PP2A", pd.Timestamp("2025-06-01"))}
+    save_edit(gui, mouse_db, "7260730690432770", "KO")
+    assert mouse_db["7260730690432770"]["genotype"] == "KO"
+    assert mouse_db["7260730690432770"]["breedDate"] == date(2025, 6, 1)
+    assert len(gui.redraws) == 1
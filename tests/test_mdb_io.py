@@ -0,0 +1,166 @@
+import copy
+import os
+
+import numpy as np
+import openpyxl
+import pandas as pd
+
+import mdb_io as mio
+
+
+def sample_sheet():
+    """A raw MDb sheet as the reader returns it, numeric toes and parents with blanks read as float."""
+    return pd.DataFrame({
+        "ID": [101, 102, 103, 104],
+        "cage": ["8-A-1", "8-A-1", "2-A-3", "Waiting Room"],
+        "sex": ["♀", "♂", "♀", "♂"],
+        "toe": [1, 12, np.nan, 3],
+        "genotype": ["WT", "KO", "WT", "KO"],
+        "birthDate": ["24-01-02", "24-02-03", "25-03-04", "25-06-01"],
+        "breedDate": ["25-01-01", None, None, None],
+        "parentF": [np.nan, np.nan, 101, 101],
+        "parentM": [np.nan, np.nan, 102, 102],
+    })
+
+def datetime_breed_date_sheet():
+    """sample_sheet with real date cells for breedDate, two of them blank, which the reader returns as datetime64."""
+    sheet = sample_sheet()
+    sheet["breedDate"] = pd.to_datetime(["2025-01-01", None, None, "2025-06-01"])
+    return sheet
+
+def read_cells(path, sheet_name):
+    """Every cell below the header as (value, openpyxl data type), so text "1" and number 1 differ."""
+    worksheet = openpyxl.load_workbook(path)[sheet_name]
+    return [[(cell.value, cell.data_type) for cell in row] for row in worksheet.iter_rows(min_row=2)]
+
+def write_both(tmp_path, df, sheet_name="MDb"):
+    """Writes df with write_df_to_sheet in constant_memory mode and with to_excel, returns both paths."""
+    new_path, baseline_path = tmp_path / "new.xlsx", tmp_path / "baseline.xlsx"
+    with pd.ExcelWriter(new_path, engine="xlsxwriter", engine_kwargs={"options": {"constant_memory": True}}) as writer:
+        mio.write_df_to_sheet(writer, df, sheet_name)
+    with pd.ExcelWriter(baseline_path, engine="xlsxwriter") as writer:
+        df.to_excel(writer, sheet_name=sheet_name, index=False)
+    return new_path, baseline_path
+
+def test_write_df_to_sheet_matches_to_excel(tmp_path):
+    df = pd.DataFrame({
+        "ID": [101, "102", 103],
+        "toe": [1, 12, "toe3"],
+        "parentF": [101.0, np.nan, 101.0], # Read as float because of the blank
+        "age": [1.5, 20.0, np.inf],
+        "sex": ["♂", "♀", None],
+        "breeder": np.array([True, False, True]),
+        "count": np.array([1, 2, 3]),
+    })
+    new_path, baseline_path = write_both(tmp_path, df)
+    assert read_cells(new_path, "MDb") == read_cells(baseline_path, "MDb")
+    pd.testing.assert_frame_equal(pd.read_excel(new_path), pd.read_excel(baseline_path))
+
+def test_excel_cell_values_types_by_value():
+    series = pd.Series([101.0, 1.5, "101", None, np.nan, np.int64(7)], dtype=object)
+    assert mio.excel_cell_values(series) == [101, 1.5, "101", "", "", 7]
+    assert type(mio.excel_cell_values(series)[0]) is int
+
+def test_write_processed_data_matches_to_excel(tmp_path):
+    processed_data = mio.data_preprocess(sample_sheet())
+    new_path, baseline_path = tmp_path / "new.xlsx", tmp_path / "baseline.xlsx"
+    assert mio.write_processed_data_to_excel(new_path, copy.deepcopy(processed_data))
+
+    # The same export frame through the plain to_excel writer
+    df_mice = mio.mice_dict_to_df(copy.deepcopy(processed_data))
+    parental_mice_live, living_mice = mio.parse_mice_data_for_write(df_mice)
+    df_to_write = mio.memorial_cleanup(df_mice, living_mice, parental_mice_live).sort_values("cage", kind="mergesort")
+    with pd.ExcelWriter(baseline_path, engine="xlsxwriter") as writer:
+        mio.mut.process_df_before_export(df_to_write, mio.DATE_COLUMNS).to_excel(writer, sheet_name="MDb", index=False)
+
+    assert read_cells(new_path, "MDb") == read_cells(baseline_path, "MDb")
+    df_saved = pd.read_excel(new_path, "MDb")
+    assert df_saved.loc[df_saved["parentF"] != "-", "parentF"].isin(df_saved["ID"]).all() # Parents still match mouse IDs
+
+def test_memorial_cleanup_keeps_parents_of_living_mice():
+    sheet = sample_sheet()
+    sheet.loc[0, ["cage", "birthDate"]] = ["Memorial", "22-01-01"] # Mother of the living 103 and 104
+    sheet.loc[4] = [105, "Memorial", "♂", 4, "WT", "22-01-01", None, np.nan, np.nan] # No living relatives
+    df_mice = mio.mice_dict_to_df(mio.data_preprocess(sheet))
+    parental_mice_live, living_mice = mio.parse_mice_data_for_write(df_mice)
+    df_to_write = mio.memorial_cleanup(df_mice, living_mice, parental_mice_live)
+    assert 101 in df_to_write.index
+    assert 105 not in df_to_write.index
+
+def test_changelog_round_trip(tmp_path):
+    sheet = sample_sheet()
+    sheet["ID"] = ["7260730690432770", "7260730690432771", "EX0001", "EX0002"] # Text IDs, as in real sheets
+    sheet[["parentF", "parentM"]] = [["-", "-"], ["-", "-"], ["7260730690432770", "7260730690432771"], ["-", "-"]]
+    old_dict = mio.data_preprocess(sheet)
+    new_dict = copy.deepcopy(old_dict)
+    new_dict["EX0001"]["toe"] = 5
+    new_dict["7260730690432771"]["nuCA"] = "2-A-9"
+    new_dict["EX0003"] = dict(new_dict["EX0002"], ID="EX0003", toe=4, parentF="7260730690432770")
+
+    log_file = mio.mice_changelog(old_dict, new_dict, tmp_path)
+    loaded_dict = copy.deepcopy(old_dict)
+    mio.changelog_loader(log_file, loaded_dict)
+
+    for mouse_id in ("EX0001", "7260730690432771", "EX0003"):
+        for field in ("nuCA", "sex", "toe", "genotype", "parentF", "parentM"):
+            expected, loaded = new_dict[mouse_id][field], loaded_dict[mouse_id][field]
+            assert (pd.isna(expected) and pd.isna(loaded)) or (expected == loaded), (mouse_id, field, loaded)
+        assert mio.mut.convert_to_date(loaded_dict[mouse_id]["birthDate"]) == new_dict[mouse_id]["birthDate"]
+
+def test_preprocess_cache_round_trip(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    excel_file = str(tmp_path / "mice.xlsx")
+    sample_sheet().to_excel(excel_file, sheet_name="MDb", index=False)
+    processed_data = mio.data_preprocess(mio.validate_excel(excel_file))
+
+    cache_file = mio.save_preprocess_cache(excel_file, processed_data)
+    if os.name != "nt":
+        assert os.stat(os.path.dirname(cache_file)).st_mode & 0o777 == 0o700
+    cached_data = mio.load_preprocess_cache(excel_file)
+    pd.testing.assert_frame_equal(mio.mice_dict_to_df(cached_data), mio.mice_dict_to_df(processed_data))
+    assert [type(value) for mouse in cached_data.values() for value in mouse.values()] == \
+           [type(value) for mouse in processed_data.values() for value in mouse.values()]
+
+    mouse_id = next(iter(processed_data))
+    del processed_data[mouse_id]["genotype"]
+    mio.save_preprocess_cache(excel_file, processed_data)
+    assert mio.load_preprocess_cache(excel_file) is None # Entries missing required columns are not trusted
+
+def test_preprocess_cache_round_trip_datetime_breed_dates(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    excel_file = str(tmp_path / "mice.xlsx")
+    datetime_breed_date_sheet().to_excel(excel_file, sheet_name="MDb", index=False)
+    processed_data = mio.data_preprocess(mio.validate_excel(excel_file))
+    breed_dates = [mouse["breedDate"] for mouse in processed_data.values()]
+    assert any(breed_date is pd.NaT for breed_date in breed_dates) and any(isinstance(breed_date, pd.Timestamp) for breed_date in breed_dates)
+
+    mio.save_preprocess_cache(excel_file, processed_data)
+    cached_data = mio.load_preprocess_cache(excel_file)
+    assert cached_data is not None
+    pd.testing.assert_frame_equal(mio.mice_dict_to_df(cached_data), mio.mice_dict_to_df(processed_data))
+    assert [type(value) for mouse in cached_data.values() for value in mouse.values()] == \
+           [type(value) for mouse in processed_data.values() for value in mouse.values()]
+
+def test_preprocess_cache_rejects_changed_file(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    excel_file = str(tmp_path / "mice.xlsx")
+    sample_sheet().to_excel(excel_file, sheet_name="MDb", index=False)
+    mio.save_preprocess_cache(excel_file, mio.data_preprocess(mio.validate_excel(excel_file)))
+
+    sheet = sample_sheet()
+    sheet.loc[0, "genotype"] = "KO"
+    sheet.to_excel(excel_file, sheet_name="MDb", index=False)
+    assert mio.load_preprocess_cache(excel_file) is None
+
+def test_find_changes_check_only_agrees_with_full_diff():
+    old_dict = mio.data_preprocess(sample_sheet())
+    unchanged = copy.deepcopy(old_dict)
+    unchanged[101]["parentF"] = None # Missing as NaN before and None now, not a change
+    toe_changed = copy.deepcopy(old_dict)
+    toe_changed[103]["toe"] = 4
+    added = copy.deepcopy(old_dict)
+    added[105] = dict(added[104], ID=105)
+
+    for new_dict in (unchanged, toe_changed, added):
+        assert mio.find_changes_for_changelog(old_dict, new_dict, check_only=True) == bool(mio.find_changes_for_changelog(old_dict, new_dict))
+    assert not mio.find_changes_for_changelog(old_dict, unchanged, check_only=True)
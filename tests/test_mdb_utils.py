@@ -0,0 +1,13 @@
+from datetime import date, timedelta
+
+import pandas as pd
+
+import mdb_utils as mut
+
+
+def test_dates_to_days_matches_date_to_days():
+    dates = pd.Series([date(2024, 1, 2), None, date.today() + timedelta(days=3), pd.Timestamp("2025-06-01"), pd.NaT, date.today()])
+    days = mut.dates_to_days(dates)
+    expected = [mut.date_to_days(date_val) for date_val in dates]
+    assert days.tolist() == expected
+    assert [type(day) for day in days] == [type(day) for day in expected] # Ints and None, never floats